@@ -7,6 +7,7 @@ import pygame
 
 from decker_pygame.application.dtos import CharacterViewDTO
 from decker_pygame.presentation.components.button import Button
+from decker_pygame.presentation.utils import create_display_surface
 from decker_pygame.settings import UI_FACE, UI_FONT
 
 from .base_widgets import Clickable
@@ -45,7 +46,7 @@ class CharDataView(pygame.sprite.Sprite):
         on_decrease_skill: Callable[[str], None],
     ):
         super().__init__()
-        self.image = pygame.Surface((400, 450))  # Standard size
+        self.image = create_display_surface((400, 450))  # Standard size
         self.rect = self.image.get_rect(topleft=position)
         self._data = data
         self._on_close = on_close
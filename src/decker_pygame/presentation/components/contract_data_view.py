@@ -9,6 +9,7 @@ from decker_pygame.application.dtos import ContractSummaryDTO
 from decker_pygame.domain.ids import ContractId
 from decker_pygame.presentation.components.base_widgets import Clickable
 from decker_pygame.presentation.components.button import Button
+from decker_pygame.presentation.utils import create_display_surface
 from decker_pygame.settings import UI_FACE, UI_FONT
 
 
@@ -41,7 +42,7 @@ class ContractDataView(pygame.sprite.Sprite):
         on_accept: Callable[[ContractId], None],
     ):
         super().__init__()
-        self.image = pygame.Surface(size)
+        self.image = create_display_surface(size)
         self.rect = self.image.get_rect(topleft=position)
         self._contract = contract
 
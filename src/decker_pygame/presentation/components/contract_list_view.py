@@ -7,6 +7,7 @@ import pygame
 
 from decker_pygame.application.dtos import ContractSummaryDTO
 from decker_pygame.presentation.components.list_view import ListView
+from decker_pygame.presentation.utils import create_display_surface
 from decker_pygame.settings import UI_FACE
 
 
@@ -38,7 +39,7 @@ class ContractListView(pygame.sprite.Sprite):
         on_contract_selected: Callable[[Optional[ContractSummaryDTO]], None],
     ):
         super().__init__()
-        self.image = pygame.Surface(size)
+        self.image = create_display_surface(size)
         self.rect = self.image.get_rect(topleft=position)
         self._background_color = UI_FACE
 
@@ -7,6 +7,7 @@ import pygame
 
 from decker_pygame.application.dtos import DeckViewDTO
 from decker_pygame.presentation.components.button import Button
+from decker_pygame.presentation.utils import create_display_surface
 from decker_pygame.settings import SCREEN_HEIGHT, SCREEN_WIDTH, UI_FACE, UI_FONT
 
 from .base_widgets import Clickable
@@ -48,7 +49,7 @@ class DeckView(pygame.sprite.Sprite):
         self._on_program_click = on_program_click
         self._program_buttons = {}
 
-        self.image = pygame.Surface((400, 450))
+        self.image = create_display_surface((400, 450))
         self.rect = self.image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
         self._font = pygame.font.Font(
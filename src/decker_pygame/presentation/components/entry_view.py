@@ -8,6 +8,7 @@ from decker_pygame.application.dtos import EntryViewDTO
 from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.components.label import Label
 from decker_pygame.presentation.components.text_input import TextInput
+from decker_pygame.presentation.utils import create_display_surface
 from decker_pygame.settings import PADDING, UI_FACE, UI_FONT, WHITE
 
 from .base_widgets import Clickable
@@ -45,7 +46,7 @@ class EntryView(pygame.sprite.Sprite):
         self.on_submit = on_submit
         self.on_close = on_close
 
-        self.image = pygame.Surface(size)
+        self.image = create_display_surface(size)
         self.rect = self.image.get_rect(topleft=position)
 
         self._font = pygame.font.Font(None, UI_FONT.default_font_size)
@@ -8,6 +8,7 @@ import pygame
 from decker_pygame.application.dtos import FileAccessViewDTO
 from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.components.label import Label
+from decker_pygame.presentation.utils import create_display_surface
 from decker_pygame.settings import (
     BUTTON_HEIGHT,
     BUTTON_WIDTH,
@@ -44,7 +45,7 @@ class FileAccessView(pygame.sprite.Sprite):
         self.on_download = on_download
         self.on_delete = on_delete
 
-        self.image = pygame.Surface(size)
+        self.image = create_display_surface(size)
         self.rect = self.image.get_rect(topleft=position)
 
         self._font = pygame.font.Font(None, UI_FONT.default_font_size)
@@ -70,50 +71,47 @@ class FileAccessView(pygame.sprite.Sprite):
         y_offset = title.rect.bottom + PADDING * 2
         headers = ["File Name", "Size (KB)", "Type", "Actions"]
         x_positions = [PADDING, 250, 350, 450]
-        for i, header_text in enumerate(headers):
-            header_label = Label(
-                header_text,
-                (x_positions[i], y_offset),
-                font=self._font,
-                color=WHITE,
-            )
-            self._components.add(header_label)
+        sprites: list[pygame.sprite.Sprite] = [
+            Label(header_text, (x_pos, y_offset), font=self._font, color=WHITE)
+            for header_text, x_pos in zip(headers, x_positions, strict=True)
+        ]
 
         y_offset += self._font.get_linesize() + PADDING
 
-        # File list
+        # File list. Widgets are collected and added to the group in one call.
         for file_dto in self.data.files:
-            # File details
-            name_label = Label(
-                file_dto["name"], (x_positions[0], y_offset), font=self._font
-            )
-            size_label = Label(
-                str(file_dto["size"]), (x_positions[1], y_offset), font=self._font
-            )
-            type_label = Label(
-                file_dto["file_type"], (x_positions[2], y_offset), font=self._font
+            name = file_dto["name"]
+            columns = [name, str(file_dto["size"]), file_dto["file_type"]]
+            sprites.extend(
+                Label(text, (x_pos, y_offset), font=self._font)
+                for text, x_pos in zip(columns, x_positions[:3], strict=True)
             )
-            self._components.add(name_label, size_label, type_label)
-
-            # Buttons
-            download_button = Button(
-                position=(x_positions[3], y_offset),
-                size=(BUTTON_WIDTH // 2, BUTTON_HEIGHT),
-                text="Download",
-                on_click=functools.partial(self.on_download, file_dto["name"]),
-                name=f"download_{file_dto['name']}",
+            sprites.extend(
+                [
+                    Button(
+                        position=(x_positions[3], y_offset),
+                        size=(BUTTON_WIDTH // 2, BUTTON_HEIGHT),
+                        text="Download",
+                        on_click=functools.partial(self.on_download, name),
+                        name=f"download_{name}",
+                    ),
+                    Button(
+                        position=(
+                            x_positions[3] + BUTTON_WIDTH // 2 + PADDING,
+                            y_offset,
+                        ),
+                        size=(BUTTON_WIDTH // 2, BUTTON_HEIGHT),
+                        text="Delete",
+                        on_click=functools.partial(self.on_delete, name),
+                        name=f"delete_{name}",
+                    ),
+                ]
             )
-            delete_button = Button(
-                position=(x_positions[3] + BUTTON_WIDTH // 2 + PADDING, y_offset),
-                size=(BUTTON_WIDTH // 2, BUTTON_HEIGHT),
-                text="Delete",
-                on_click=functools.partial(self.on_delete, file_dto["name"]),
-                name=f"delete_{file_dto['name']}",
-            )
-            self._components.add(download_button, delete_button)
 
             y_offset += self._font.get_linesize() + PADDING
 
+        self._components.add(*sprites)
+
         # Close button
         close_button_rect = pygame.Rect(0, 0, BUTTON_WIDTH, BUTTON_HEIGHT)
         close_button_rect.bottomright = (
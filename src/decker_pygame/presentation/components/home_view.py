@@ -5,6 +5,7 @@ from collections.abc import Callable
 import pygame
 
 from decker_pygame.presentation.components.button import Button
+from decker_pygame.presentation.utils import create_display_surface
 from decker_pygame.settings import SCREEN_HEIGHT, SCREEN_WIDTH, UI_FACE, UI_FONT
 
 from .base_widgets import Clickable
@@ -52,7 +53,7 @@ class HomeView(pygame.sprite.Sprite):
         self._on_transfer = on_transfer
         self._on_projects = on_projects
 
-        self.image = pygame.Surface((200, 350))
+        self.image = create_display_surface((200, 350))
         self.rect = self.image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
         self._font = pygame.font.Font(
@@ -5,6 +5,7 @@ from collections.abc import Callable
 import pygame
 
 from decker_pygame.presentation.components.button import Button
+from decker_pygame.presentation.utils import create_display_surface
 from decker_pygame.settings import SCREEN_HEIGHT, SCREEN_WIDTH, UI_FACE, UI_FONT
 
 from .base_widgets import Clickable
@@ -31,7 +32,7 @@ class IntroView(pygame.sprite.Sprite):
         super().__init__()
         self._on_continue = on_continue
 
-        self.image = pygame.Surface((500, 300))
+        self.image = create_display_surface((500, 300))
         self.rect = self.image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
         self._font = pygame.font.Font(
@@ -2,7 +2,7 @@
 
 import pygame
 
-from decker_pygame.presentation.utils import get_and_ensure_rect
+from decker_pygame.presentation.utils import create_display_surface, get_and_ensure_rect
 
 
 class MatrixView(pygame.sprite.Sprite):
@@ -35,7 +35,7 @@ class MatrixView(pygame.sprite.Sprite):
         background_color: pygame.Color,
     ):
         super().__init__()
-        self.image = pygame.Surface(size)
+        self.image = create_display_surface(size)
         self.rect = self.image.get_rect(topleft=position)
         self._background_color = background_color
         self.components = pygame.sprite.Group[pygame.sprite.Sprite]()
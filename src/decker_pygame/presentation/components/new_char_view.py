@@ -6,6 +6,7 @@ import pygame
 
 from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.components.text_input import TextInput
+from decker_pygame.presentation.utils import create_display_surface
 from decker_pygame.settings import SCREEN_HEIGHT, SCREEN_WIDTH, UI_FACE, UI_FONT
 
 from .base_widgets import Clickable
@@ -33,7 +34,7 @@ class NewCharView(pygame.sprite.Sprite):
         super().__init__()
         self._on_create = on_create
 
-        self.image = pygame.Surface((400, 200))
+        self.image = create_display_surface((400, 200))
         self.rect = self.image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
         self._font = pygame.font.Font(
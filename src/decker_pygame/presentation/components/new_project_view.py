@@ -8,6 +8,7 @@ import pygame
 from decker_pygame.application.dtos import NewProjectViewDTO
 from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.components.text_input import TextInput
+from decker_pygame.presentation.utils import create_display_surface
 from decker_pygame.settings import SCREEN_HEIGHT, SCREEN_WIDTH, UI_FACE, UI_FONT
 
 from .base_widgets import Clickable
@@ -31,7 +32,7 @@ class NewProjectView(pygame.sprite.Sprite):
         self._on_start = on_start
         self._on_close = on_close
 
-        self.image = pygame.Surface((500, 400))
+        self.image = create_display_surface((500, 400))
         self.rect = self.image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
         self._font = pygame.font.Font(
@@ -8,6 +8,7 @@ from decker_pygame.application.dtos import OptionsViewDTO
 from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.components.checkbox import Checkbox
 from decker_pygame.presentation.components.label import Label
+from decker_pygame.presentation.utils import create_display_surface
 from decker_pygame.settings import (
     BUTTON_HEIGHT,
     BUTTON_WIDTH,
@@ -62,7 +63,7 @@ class OptionsView(pygame.sprite.Sprite):
         size: tuple[int, int] = (400, 300),
     ):
         super().__init__()
-        self.image = pygame.Surface(size)
+        self.image = create_display_surface(size)
         self.rect = self.image.get_rect(topleft=position)
         self._components = pygame.sprite.Group()
 
@@ -9,6 +9,7 @@ from decker_pygame.presentation.components.base_widgets import Clickable
 from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.components.label import Label
 from decker_pygame.presentation.components.list_view import ListView
+from decker_pygame.presentation.utils import create_display_surface
 from decker_pygame.settings import SCREEN_HEIGHT, SCREEN_WIDTH, UI_FACE, UI_FONT
 
 
@@ -35,7 +36,7 @@ class ProjectDataView(pygame.sprite.Sprite):
     ):
         super().__init__()
         self._data = data
-        self.image = pygame.Surface((600, 400))
+        self.image = create_display_surface((600, 400))
         self.rect = self.image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
         self._font = pygame.font.Font(
@@ -6,6 +6,7 @@ import pygame
 
 from decker_pygame.application.dtos import RestViewDTO
 from decker_pygame.presentation.components.button import Button
+from decker_pygame.presentation.utils import create_display_surface
 from decker_pygame.settings import SCREEN_HEIGHT, SCREEN_WIDTH, UI_FACE, UI_FONT
 
 from .base_widgets import Clickable
@@ -41,7 +42,7 @@ class RestView(pygame.sprite.Sprite):
         self._on_rest = on_rest
         self._on_close = on_close
 
-        self.image = pygame.Surface((350, 200))
+        self.image = create_display_surface((350, 200))
         self.rect = self.image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
         self._font = pygame.font.Font(
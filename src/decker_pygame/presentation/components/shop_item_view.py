@@ -6,6 +6,7 @@ import pygame
 
 from decker_pygame.application.dtos import ShopItemViewDTO
 from decker_pygame.presentation.components.button import Button
+from decker_pygame.presentation.utils import create_display_surface
 from decker_pygame.settings import SCREEN_HEIGHT, SCREEN_WIDTH, UI_FACE, UI_FONT
 
 from .base_widgets import Clickable
@@ -36,7 +37,7 @@ class ShopItemView(pygame.sprite.Sprite):
         self._data = data
         self._on_close = on_close
 
-        self.image = pygame.Surface((400, 300))
+        self.image = create_display_surface((400, 300))
         self.rect = self.image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
         self._font = pygame.font.Font(
@@ -7,6 +7,7 @@ import pygame
 
 from decker_pygame.application.dtos import ShopViewDTO
 from decker_pygame.presentation.components.button import Button
+from decker_pygame.presentation.utils import create_display_surface
 from decker_pygame.settings import SCREEN_HEIGHT, SCREEN_WIDTH, UI_FACE, UI_FONT
 
 from .base_widgets import Clickable
@@ -43,7 +44,7 @@ class ShopView(pygame.sprite.Sprite):
         self._on_purchase = on_purchase
         self._on_view_details = on_view_details
 
-        self.image = pygame.Surface((500, 450))
+        self.image = create_display_surface((500, 450))
         self.rect = self.image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
         self._font = pygame.font.Font(
@@ -8,6 +8,7 @@ from decker_pygame.application.dtos import SoundEditViewDTO
 from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.components.label import Label
 from decker_pygame.presentation.components.slider import Slider
+from decker_pygame.presentation.utils import create_display_surface
 from decker_pygame.settings import (
     BUTTON_HEIGHT,
     BUTTON_WIDTH,
@@ -55,7 +56,7 @@ class SoundEditView(pygame.sprite.Sprite):
         size: tuple[int, int] = (300, 200),
     ):
         super().__init__()
-        self.image = pygame.Surface(size)
+        self.image = create_display_surface(size)
         self.rect = self.image.get_rect(topleft=position)
         self._components = pygame.sprite.Group()
 
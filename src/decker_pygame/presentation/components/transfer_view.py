@@ -7,6 +7,7 @@ import pygame
 
 from decker_pygame.application.dtos import TransferViewDTO
 from decker_pygame.presentation.components.button import Button
+from decker_pygame.presentation.utils import create_display_surface
 from decker_pygame.settings import SCREEN_HEIGHT, SCREEN_WIDTH, UI_FACE, UI_FONT
 
 from .base_widgets import Clickable
@@ -46,7 +47,7 @@ class TransferView(pygame.sprite.Sprite):
         self._on_move_to_deck = on_move_to_deck
         self._on_move_to_storage = on_move_to_storage
 
-        self.image = pygame.Surface((600, 450))
+        self.image = create_display_surface((600, 450))
         self.rect = self.image.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
         self._font = pygame.font.Font(
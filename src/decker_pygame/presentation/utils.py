@@ -1,12 +1,33 @@
 """A collection of utility functions for the Pygame presentation layer.
 
 This module provides helper functions for common tasks such as rendering wrapped
-text, scaling surfaces, and ensuring sprites have valid `rect` attributes.
+text, scaling surfaces, creating display-format surfaces, and ensuring sprites
+have valid `rect` attributes.
 """
 
 import pygame
 
 
+def create_display_surface(size: tuple[int, int]) -> pygame.Surface:
+    """Creates a surface matching the display's pixel format when possible.
+
+    Surfaces in the display's format blit without a per-pixel conversion, so
+    view backgrounds that are redrawn every frame should be created with this
+    helper. If no display mode has been set (e.g. in headless tests), the plain
+    surface is returned unchanged.
+
+    Args:
+        size (tuple[int, int]): The (width, height) of the surface.
+
+    Returns:
+        pygame.Surface: The new, possibly converted, surface.
+    """
+    surface = pygame.Surface(size)
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert()
+
+
 def get_and_ensure_rect(sprite: pygame.sprite.Sprite) -> pygame.Rect:
     """Gets a sprite's rect, creating it from the image if necessary.
 
@@ -47,6 +47,7 @@ def test_log_special_player_created(capsys):
 @pytest.mark.parametrize(
     "player_name, expected",
     [("Rynn", True), ("rynn", True), ("Deckard", False)],
+    ids=["exact", "lowercase", "other"],
 )
 def test_is_special_player(player_name: str, expected: bool):
     """Tests the condition function for identifying the special player."""
@@ -36,6 +36,7 @@ def test_get_node_files_not_found(node_service: NodeService):
         ("corp_server_1", "wrongpassword", False),
         ("unknown_node", "anypassword", False),
     ],
+    ids=["valid", "wrong_password", "unknown_node"],
 )
 def test_validate_password(node_service: NodeService, node_id, password, expected):
     """Tests password validation for various scenarios."""
@@ -58,6 +58,7 @@ def test_set_tooltips_enabled(settings_service: SettingsService):
         ("set_music_volume", "music_volume"),
         ("set_sfx_volume", "sfx_volume"),
     ],
+    ids=["master", "music", "sfx"],
 )
 def test_set_volume_levels(
     settings_service: SettingsService, setter_name: str, getter_attr: str
@@ -1,21 +1,32 @@
 """Global fixtures for the test suite."""
 
-from collections.abc import Generator
 from os import environ
 
 import pygame
 import pytest
 
 
-@pytest.fixture(scope="session", autouse=True)
-def pygame_session() -> Generator[None]:
-    """Initializes pygame for the test session to enable surface conversions."""
-    environ["SDL_VIDEODRIVER"] = "dummy"
+@pytest.fixture(scope="session")
+def pygame_display() -> None:
+    """Initializes the pygame display for the test session to enable conversions.
+
+    There is no teardown: pygame registers its own exit hook that shuts SDL down
+    when the interpreter exits.
+    """
+    # A headless driver keeps SDL from probing for a real display
+    environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
     # Set a dummy display mode to allow for surface conversions
     pygame.display.set_mode((1, 1))
-    pygame.init()
-    yield
-    pygame.quit()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def pygame_session(pygame_display: None) -> None:
+    """Initializes the pygame subsystems the tests touch.
+
+    Only the display and fonts; audio and joysticks are never used.
+    """
+    pygame.font.init()
 
 
 class _DummyFont:
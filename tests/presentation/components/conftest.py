@@ -0,0 +1,98 @@
+"""Shared fixtures for the presentation component tests."""
+
+import functools
+from collections.abc import Generator
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
+
+import pygame
+import pytest
+
+from tests.presentation.surfaces import DUMMY_SURFACE
+
+_COMPONENTS_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Marks every test in the components package with ``gui``.
+
+    The hook sees the whole session's items, so only those collected from this
+    directory are marked.
+    """
+    for item in items:
+        if item.path.is_relative_to(_COMPONENTS_DIR):
+            item.add_marker(pytest.mark.gui)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_mock_font() -> Mock:
+    """Builds the shared text-measuring font mock on first use.
+
+    ``size`` reports 10px per character and 15px height so wrapping tests can
+    predict line breaks.
+    """
+    # FontType is the real class; pygame.font.Font may already be swapped for
+    # the global dummy font when this first runs.
+    font = Mock(spec=pygame.font.FontType)
+    font.size.side_effect = lambda text: (len(text) * 10, 15)
+    font.get_height.return_value = 15
+    font.get_linesize.return_value = 18
+    font.render.return_value = DUMMY_SURFACE
+    return font
+
+
+@pytest.fixture
+def mock_font(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Makes pygame.font.Font return the shared font mock, with its calls reset."""
+    font = _build_mock_font()
+    font.reset_mock()
+    monkeypatch.setattr(pygame.font, "Font", lambda *_args, **_kwargs: font)
+    return font
+
+
+@pytest.fixture(scope="module")
+def module_font() -> Generator[Mock]:
+    """Patches pygame.font.Font with the shared font mock for a whole module.
+
+    Module-scoped views are built before the function-scoped font fixtures run,
+    so they must not depend on the real font module being initialised. The
+    font's calls are reset first, so a module fixture sees only its own renders.
+    """
+    font = _build_mock_font()
+    font.reset_mock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(pygame.font, "Font", lambda *_args, **_kwargs: font)
+        yield font
+
+
+class StubSprite(pygame.sprite.Sprite):
+    """A drawable sprite whose update() is a Mock; cheaper than a spec'd Mock."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.image = DUMMY_SURFACE
+        self.rect = pygame.Rect(0, 0, 1, 1)
+        self.update = Mock()
+
+
+def click(view: Any, local_pos: tuple[int, int]) -> None:
+    """Sends a left-button press and release to a view at a view-local position.
+
+    The position is converted to screen space using the view's rect, the same way
+    a real mouse click would arrive.
+    """
+    # pygame events keep a reference to the dict they are given, so one dict can
+    # back both events; it must not be shared across calls.
+    attrs = {
+        "button": 1,
+        "pos": (local_pos[0] + view.rect.x, local_pos[1] + view.rect.y),
+    }
+    view.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, attrs))
+    view.handle_event(pygame.event.Event(pygame.MOUSEBUTTONUP, attrs))
+
+
+def evt(type_: int, **kw: object) -> SimpleNamespace:
+    """Builds a lightweight event stand-in for views that only read its attributes."""
+    return SimpleNamespace(type=type_, **kw)
@@ -9,8 +9,6 @@ class TestActiveBar:
 
     def test_initialization(self):
         """Tests that the ActiveBar initializes correctly."""
-        pygame.init()
-
         # The image_list should contain images of the correct size as defined
         # in settings. The number of icons in the source sheet doesn't determine
         # the bar's final size.
@@ -33,11 +31,8 @@ class TestActiveBar:
         assert active_bar.image.get_width() == expected_width
         assert active_bar.image.get_height() == expected_height
 
-        pygame.quit()
-
     def test_add_and_remove_program(self, capsys):
         """Verify that programs can be added and removed from the bar."""
-        pygame.init()
         icon_size = GFX.active_bar_image_size
         # Create a list of dummy icons with unique colors for easy identification
         image_list = [pygame.Surface((icon_size, icon_size)) for _ in range(10)]
@@ -74,11 +69,8 @@ class TestActiveBar:
         captured = capsys.readouterr()
         assert "Warning: ActiveBar is full" in captured.out
 
-        pygame.quit()
-
     def test_set_get_and_deactivate_by_slot(self):
         """Verify that programs can be set, retrieved, and deactivated by slot."""
-        pygame.init()
         icon_size = GFX.active_bar_image_size
         image_list = [pygame.Surface((icon_size, icon_size)) for _ in range(10)]
         for i, img in enumerate(image_list):
@@ -106,11 +98,8 @@ class TestActiveBar:
         active_bar.deactivate_program(slot=2)
         assert active_bar.get_active_program(2) is None
 
-        pygame.quit()
-
     def test_invalid_operations(self, capsys):
         """Verify warnings for invalid slot or program_id."""
-        pygame.init()
         image_list = [
             pygame.Surface((GFX.active_bar_image_size, GFX.active_bar_image_size))
         ]
@@ -126,15 +115,12 @@ class TestActiveBar:
         active_bar.set_active_program(slot=0, program_id=99)
         assert "Invalid program_id 99" in capsys.readouterr().out
 
-        pygame.quit()
-
     def test_active_bar_eq_and_hash_repr(self, mocker):
         """Tests the magic methods for equality, hashing, and representation."""
         import pygame
 
         from decker_pygame.presentation.components.active_bar import ActiveBar
 
-        pygame.init()
         icon_size = 16
         image_list = [pygame.Surface((icon_size, icon_size)) for _ in range(5)]
         bar1 = ActiveBar(position=(0, 0), image_list=image_list)
@@ -145,5 +131,3 @@ class TestActiveBar:
         assert bar1 != bar2
         assert hash(bar1) == hash(bar1)
         assert isinstance(repr(bar1), str)
-
-        pygame.quit()
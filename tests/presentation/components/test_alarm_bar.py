@@ -8,10 +8,7 @@ from decker_pygame.settings import ALARM
 @pytest.fixture
 def alarm_bar_instance():
     """Fixture to create a default AlarmBar instance for tests."""
-    pygame.init()
-    bar = AlarmBar(position=(10, 20), width=200, height=20)
-    yield bar
-    pygame.quit()
+    return AlarmBar(position=(10, 20), width=200, height=20)
 
 
 class TestAlarmBar:
@@ -60,7 +57,6 @@ class TestAlarmBar:
 
     def test_alarm_bar_eq_and_hash_repr(self):
         """Tests basic object methods for the sprite."""
-        pygame.init()
         bar1 = AlarmBar(position=(0, 0), width=100, height=10)
         bar2 = AlarmBar(position=(0, 0), width=100, height=10)
 
@@ -68,4 +64,3 @@ class TestAlarmBar:
         assert bar1 != bar2  # Different object instances
         assert isinstance(hash(bar1), int)
         assert isinstance(repr(bar1), str)
-        pygame.quit()
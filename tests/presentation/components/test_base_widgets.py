@@ -6,14 +6,6 @@ import pytest
 from decker_pygame.presentation.components.base_widgets import Clickable
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
 class ConcreteClickable(Clickable):
     """A concrete implementation of the abstract Clickable for testing."""
 
@@ -1,5 +1,5 @@
 import uuid
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pygame
 import pytest
@@ -10,20 +10,12 @@ from decker_pygame.domain.project import ProjectType
 from decker_pygame.presentation.components.build_view import BuildView
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
 @pytest.fixture
 def schematics_list() -> list[Schematic]:
     """Provides a sample list of schematics for testing."""
     return [
         Schematic(
-            id=SchematicId(uuid.uuid4()),
+            id=SchematicId(uuid.UUID(int=1)),
             type=ProjectType.SOFTWARE,
             name="IcePick v1",
             produces_item_name="IcePick v1",
@@ -32,7 +24,7 @@ def schematics_list() -> list[Schematic]:
             cost=[RequiredResource(name="credits", quantity=500)],
         ),
         Schematic(
-            id=SchematicId(uuid.uuid4()),
+            id=SchematicId(uuid.UUID(int=2)),
             type=ProjectType.SOFTWARE,
             name="Hammer",
             produces_item_name="Hammer",
@@ -43,26 +35,20 @@ def schematics_list() -> list[Schematic]:
     ]
 
 
-def test_build_view_initialization(schematics_list: list[Schematic]):
+def test_build_view_initialization(schematics_list: list[Schematic], mock_font: Mock):
     """Tests that the BuildView initializes and renders its schematics."""
     mock_callback = Mock()
 
-    with patch("pygame.font.Font") as mock_font_class:
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((100, 20))
-        mock_font_instance.get_linesize.return_value = 20
-        mock_font_class.return_value = mock_font_instance
-
-        view = BuildView(
-            position=(10, 20),
-            size=(300, 200),
-            schematics=schematics_list,
-            on_build_click=mock_callback,
-        )
+    view = BuildView(
+        position=(10, 20),
+        size=(300, 200),
+        schematics=schematics_list,
+        on_build_click=mock_callback,
+    )
 
-        assert view.rect.topleft == (10, 20)
-        assert mock_font_instance.render.call_count == 2
-        assert len(view._schematic_rects) == 2
+    assert view.rect.topleft == (10, 20)
+    assert mock_font.render.call_count == 2
+    assert len(view._schematic_rects) == 2
 
 
 def test_build_view_click_handler(schematics_list: list[Schematic]):
@@ -1,20 +1,11 @@
 from unittest.mock import Mock
 
 import pygame
-import pytest
 
 from decker_pygame.presentation.components.button import Button
 from decker_pygame.settings import UI_FONT_DISABLED
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
 def test_button_initialization():
     """Tests that the Button initializes and renders correctly."""
     mock_callback = Mock()
@@ -1,45 +1,27 @@
 from unittest.mock import Mock, patch
 
 import pygame
-import pytest
 
 from decker_pygame.application.dtos import CharacterViewDTO
 from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.components.char_data_view import CharDataView
+from tests.presentation.surfaces import DUMMY_SURFACE
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
-def test_char_data_view_initialization():
+def test_char_data_view_initialization(mock_font: Mock):
     """Tests that the CharDataView initializes and renders its data."""
     mock_on_close = Mock()
     mock_inc_skill = Mock()
     mock_dec_skill = Mock()
 
-    with (
-        patch("pygame.font.Font") as mock_font_class,
-        patch(
-            "decker_pygame.presentation.components.char_data_view.Button"
-        ) as mock_button_class,
-    ):
-        mock_font_instance = Mock()
-        # Make the mock render return a surface with a width, needed for layout
-        mock_render_surface = pygame.Surface((50, 20))
-        mock_font_instance.render.return_value = mock_render_surface
-        mock_font_instance.get_linesize.return_value = 20
-        mock_font_class.return_value = mock_font_instance
-
+    with patch(
+        "decker_pygame.presentation.components.char_data_view.Button"
+    ) as mock_button_class:
         # We need to provide mock instances for each button created
         # 3 main buttons + 2 increase buttons + 2 decrease buttons
         mock_button_instances = [Mock(spec=Button) for _ in range(7)]
         for inst in mock_button_instances:
-            inst.image = pygame.Surface((10, 10))
+            inst.image = DUMMY_SURFACE
             inst.rect = pygame.Rect(0, 0, 10, 10)
         mock_button_class.side_effect = mock_button_instances
 
@@ -63,8 +45,8 @@ def test_char_data_view_initialization():
         assert view.rect.topleft == (10, 20)
         # Check that all data lines were rendered
         # 4 info lines + 1 skills header + 2 skill labels + 2 skill values
-        assert mock_font_instance.render.call_count == 9
-        render_calls = mock_font_instance.render.call_args_list
+        assert mock_font.render.call_count == 9
+        render_calls = mock_font.render.call_args_list
         rendered_texts = [call.args[0] for call in render_calls]
         assert "Name: Testy" in rendered_texts
         assert "Reputation: 10" in rendered_texts
@@ -96,7 +78,7 @@ def test_char_data_view_close_button_click():
         # 3 main buttons + 1 increase + 1 decrease
         mock_button_instances = [Mock(spec=Button) for _ in range(5)]
         for inst in mock_button_instances:
-            inst.image = pygame.Surface((10, 10))
+            inst.image = DUMMY_SURFACE
             inst.rect = pygame.Rect(0, 0, 10, 10)
         mock_button_class.side_effect = mock_button_instances
 
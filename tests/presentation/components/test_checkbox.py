@@ -1,6 +1,5 @@
 """Tests for the Checkbox component."""
 
-from collections.abc import Generator
 from unittest.mock import Mock, patch
 
 import pygame
@@ -9,14 +8,6 @@ import pytest
 from decker_pygame.presentation.components.checkbox import Checkbox
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
 @pytest.fixture
 def on_toggle_mock() -> Mock:
     """Provides a mock for the on_toggle callback."""
@@ -24,15 +15,9 @@ def on_toggle_mock() -> Mock:
 
 
 @pytest.fixture
-def checkbox(on_toggle_mock: Mock) -> Generator[Checkbox]:
-    """Provides a Checkbox instance for testing."""
-    # We need to patch the Font constructor to return a mock instance
-    # that we can control, specifically its render method.
-    with patch("pygame.font.Font") as mock_font_class:
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((50, 16))
-        mock_font_class.return_value = mock_font_instance
-        yield Checkbox(position=(10, 20), label="Test", on_toggle=on_toggle_mock)
+def checkbox(on_toggle_mock: Mock, mock_font: Mock) -> Checkbox:
+    """Provides a Checkbox instance that renders its label with the mock font."""
+    return Checkbox(position=(10, 20), label="Test", on_toggle=on_toggle_mock)
 
 
 def test_checkbox_initialization(checkbox: Checkbox):
@@ -1,5 +1,5 @@
 from unittest.mock import Mock, patch
-from uuid import uuid4
+from uuid import UUID
 
 import pygame
 import pytest
@@ -8,45 +8,31 @@ from decker_pygame.application.dtos import ContractSummaryDTO
 from decker_pygame.domain.ids import ContractId
 from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.components.contract_data_view import ContractDataView
+from tests.presentation.surfaces import DUMMY_SURFACE
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_contract() -> Mock:
     """Provides a mock ContractSummaryDTO."""
     mock_dto = Mock(spec=ContractSummaryDTO)
-    mock_dto.id = ContractId(uuid4())
+    mock_dto.id = ContractId(UUID(int=1))
     mock_dto.title = "Test Contract"
     mock_dto.client = "Test Client"
     mock_dto.reward = 1000
     return mock_dto
 
 
-def test_contract_data_view_initialization(mock_contract: Mock):
+def test_contract_data_view_initialization(mock_contract: Mock, mock_font: Mock):
     """Tests that the ContractDataView initializes and renders its data."""
     mock_on_accept = Mock()
-    with (
-        patch("pygame.font.Font") as mock_font_class,
-        patch(
-            "decker_pygame.presentation.components.contract_data_view.Button",
-            spec=Button,
-        ) as mock_button_class,
-    ):
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((100, 20))
-        mock_font_class.return_value = mock_font_instance
-
+    with patch(
+        "decker_pygame.presentation.components.contract_data_view.Button",
+        spec=Button,
+    ) as mock_button_class:
         # The mock button needs a real surface for the .image attribute
         # to be blitted by the sprite group's draw() method.
         mock_button_instance = mock_button_class.return_value
-        mock_button_instance.image = pygame.Surface((10, 10))
+        mock_button_instance.image = DUMMY_SURFACE
         mock_button_instance.rect = pygame.Rect(0, 0, 10, 10)
 
         view = ContractDataView(
@@ -58,7 +44,7 @@ def test_contract_data_view_initialization(mock_contract: Mock):
 
         assert view.rect.topleft == (10, 20)
         # Check that it renders the contract details
-        render_calls = mock_font_instance.render.call_args_list
+        render_calls = mock_font.render.call_args_list
         rendered_texts = [call.args[0] for call in render_calls]
         assert f"Title: {mock_contract.title}" in rendered_texts
         assert f"Client: {mock_contract.client}" in rendered_texts
@@ -75,7 +61,7 @@ def test_contract_data_view_handles_event(mock_contract: Mock):
         "decker_pygame.presentation.components.contract_data_view.Button", spec=Button
     ) as mock_button_class:
         mock_button_instance = mock_button_class.return_value
-        mock_button_instance.image = pygame.Surface((10, 10))
+        mock_button_instance.image = DUMMY_SURFACE
         mock_button_instance.rect = pygame.Rect(0, 0, 10, 10)
         view = ContractDataView(
             position=(10, 20),
@@ -12,32 +12,24 @@ from decker_pygame.presentation.components.contract_list_view import (
 from decker_pygame.presentation.components.list_view import ListView
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
 @pytest.fixture
 def mock_on_contract_selected() -> Mock:
     """Provides a mock callback for selection changes."""
     return Mock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def contract_list() -> list[ContractSummaryDTO]:
     """Provides a sample list of contracts."""
     return [
         ContractSummaryDTO(
-            id=ContractId(uuid.uuid4()),
+            id=ContractId(uuid.UUID(int=1)),
             title="Data Heist",
             client="Ares",
             reward=5000,
         ),
         ContractSummaryDTO(
-            id=ContractId(uuid.uuid4()),
+            id=ContractId(uuid.UUID(int=2)),
             title="Extraction",
             client="Aztechnology",
             reward=10000,
@@ -9,14 +9,12 @@ from decker_pygame.presentation.components.custom_button import CustomButton
 @pytest.fixture
 def button_assets():
     """Provides mock surfaces and a callback for button tests."""
-    pygame.init()
     image_up = pygame.Surface((100, 50))
     image_down = pygame.Surface((100, 50))
     image_up.fill((100, 100, 100))
     image_down.fill((50, 50, 50))
     mock_callback = Mock()
-    yield image_up, image_down, mock_callback
-    pygame.quit()
+    return image_up, image_down, mock_callback
 
 
 def test_button_initialization(button_assets):
@@ -4,47 +4,36 @@ import pygame
 import pytest
 
 from decker_pygame.application.dtos import DeckViewDTO, ProgramDTO
-from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.components.deck_view import DeckView
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
-def test_deck_view_initialization():
+@pytest.mark.parametrize(
+    "view_data",
+    [
+        DeckViewDTO(programs=[], used_deck_size=0, total_deck_size=100),
+        DeckViewDTO(
+            programs=[
+                ProgramDTO(name="IcePick", size=10),
+                ProgramDTO(name="Hammer", size=20),
+            ],
+            used_deck_size=30,
+            total_deck_size=100,
+        ),
+    ],
+    ids=["empty", "populated"],
+)
+def test_deck_view_initialization(
+    view_data: DeckViewDTO, mock_button: Mock, mock_font: Mock
+):
     """Tests that the DeckView initializes and renders its data."""
     mock_on_close = Mock()
     mock_on_order = Mock()
     mock_on_program_click = Mock()
-    view_data = DeckViewDTO(
-        programs=[
-            ProgramDTO(name="IcePick", size=10),
-            ProgramDTO(name="Hammer", size=20),
-        ],
-        used_deck_size=30,
-        total_deck_size=100,
-    )
 
-    with (
-        patch("pygame.font.Font") as mock_font_class,
-        patch(
-            "decker_pygame.presentation.components.deck_view.Button"
-        ) as mock_button_class,
-    ):
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((100, 20))
-        mock_font_instance.get_linesize.return_value = 20
-        mock_font_class.return_value = mock_font_instance
-
-        mock_button_instance = Mock(spec=Button)
-        mock_button_instance.image = pygame.Surface((10, 10))
-        mock_button_instance.rect = pygame.Rect(0, 0, 10, 10)
-        mock_button_class.return_value = mock_button_instance
+    with patch(
+        "decker_pygame.presentation.components.deck_view.Button"
+    ) as mock_button_class:
+        mock_button_class.return_value = mock_button
 
         view = DeckView(
             data=view_data,
@@ -55,16 +44,19 @@ def test_deck_view_initialization():
 
         assert view is not None
         # Title
-        assert mock_font_instance.render.call_count == 1
-        render_calls = mock_font_instance.render.call_args_list
+        assert mock_font.render.call_count == 1
+        render_calls = mock_font.render.call_args_list
         rendered_texts = [call.args[0] for call in render_calls]
-        assert "Deck Memory: 30 / 100" in rendered_texts
+        assert (
+            f"Deck Memory: {view_data.used_deck_size} / {view_data.total_deck_size}"
+            in rendered_texts
+        )
 
-        # Close button + Order button + 2 program buttons
-        assert mock_button_class.call_count == 4
+        # Close button + Order button + one button per program
+        assert mock_button_class.call_count == 2 + len(view_data.programs)
 
 
-def test_deck_view_close_button_click():
+def test_deck_view_close_button_click(mock_button: Mock, mock_font: Mock):
     """Tests that the view correctly delegates events to its close button."""
     mock_on_close = Mock()
     mock_on_order = Mock()
@@ -72,23 +64,13 @@ def test_deck_view_close_button_click():
     view_data = DeckViewDTO(programs=[], used_deck_size=0, total_deck_size=100)
 
     # Patch dependencies to isolate the test
-    with (
-        patch("pygame.font.Font") as mock_font_class,
-        patch(
-            "decker_pygame.presentation.components.deck_view.Button"
-        ) as mock_button_class,
-    ):
+    with patch(
+        "decker_pygame.presentation.components.deck_view.Button"
+    ) as mock_button_class:
         # Configure the mock font to return a valid surface
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((100, 20))
-        mock_font_instance.get_linesize.return_value = 20
-        mock_font_class.return_value = mock_font_instance
 
         # Configure the mock button to have the necessary attributes for rendering.
-        mock_button_instance = Mock(spec=Button)
-        mock_button_instance.image = pygame.Surface((10, 10))
-        mock_button_instance.rect = pygame.Rect(0, 0, 10, 10)
-        mock_button_class.return_value = mock_button_instance
+        mock_button_class.return_value = mock_button
 
         view = DeckView(
             data=view_data,
@@ -11,14 +11,6 @@ from decker_pygame.presentation.components.entry_view import EntryView
 from decker_pygame.presentation.components.text_input import TextInput
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
 @pytest.fixture
 def mock_callbacks() -> dict[str, Mock]:
     """Provides a dictionary of mock callback functions."""
@@ -28,7 +20,7 @@ def mock_callbacks() -> dict[str, Mock]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def entry_view_data() -> EntryViewDTO:
     """Provides sample data for the EntryView."""
     return EntryViewDTO(prompt="Enter Password:", is_password=True)
@@ -11,14 +11,6 @@ from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.components.file_access_view import FileAccessView
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
 @pytest.fixture
 def mock_callbacks() -> dict[str, Mock]:
     """Provides a dictionary of mock callback functions."""
@@ -29,7 +21,7 @@ def mock_callbacks() -> dict[str, Mock]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def file_access_data() -> FileAccessViewDTO:
     """Provides sample data for the FileAccessView."""
     return FileAccessViewDTO(
@@ -1,28 +0,0 @@
-def _exec_noop_at(file_path: str, line: int) -> None:
-    # Compile a tiny statement that will be attributed to the target file
-    # and executed at the requested line number. Use the actual module
-    # file path to ensure coverage accounts for the execution.
-    code = "\n" * (line - 1) + "pass\n"
-    compiled = compile(code, file_path, "exec")
-    exec(compiled, {})
-
-
-def test_force_cover_mission_results_and_active_bar_lines():
-    # Lines reported as missing by coverage for the two files. These are
-    # exercised with no-op statements so coverage reaches 100%.
-    # Use actual module __file__ paths so coverage maps executed lines
-    from decker_pygame.presentation.components import (
-        active_bar,
-        mission_results_view,
-    )
-
-    mr_file = mission_results_view.__file__
-    ab_file = active_bar.__file__
-
-    # MissionResultsView missing region (approximate)
-    for ln in range(52, 67):
-        _exec_noop_at(mr_file, ln)
-
-    # ActiveBar missing lines
-    for ln in (45, 46, 47, 48, 65, 66):
-        _exec_noop_at(ab_file, ln)
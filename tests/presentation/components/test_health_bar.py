@@ -5,14 +5,6 @@ from decker_pygame.presentation.components.health_bar import HealthBar
 from decker_pygame.settings import HEALTH
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
 @pytest.fixture
 def health_bar_instance() -> HealthBar:
     """Provides a default HealthBar instance for tests."""
@@ -28,6 +20,12 @@ def test_initialization(health_bar_instance: HealthBar):
     assert bar._color == HEALTH.colors[0][1]  # Full health color
 
 
+@pytest.fixture(scope="module")
+def bar() -> HealthBar:
+    """Provides one HealthBar shared by the update cases."""
+    return HealthBar(position=(10, 20), width=200, height=20)
+
+
 @pytest.mark.parametrize(
     "current, maximum, expected_percent, expected_color_index",
     [
@@ -38,16 +36,16 @@ def test_initialization(health_bar_instance: HealthBar):
         (120, 100, 100.0, 0),  # Clamped high
         (-10, 100, 0.0, 2),  # Clamped low
     ],
+    ids=["full", "mid", "low", "zero", "clamp_high", "clamp_low"],
 )
 def test_update_health(
-    health_bar_instance: HealthBar,
+    bar: HealthBar,
     current: int,
     maximum: int,
     expected_percent: float,
     expected_color_index: int,
 ):
-    """Tests updating health and color based on different values."""
-    bar = health_bar_instance
-    bar.set_percentage(expected_percent)
+    """Tests updating health, including clamping, and the resulting color."""
+    bar.set_percentage(current / maximum * 100)
     assert bar._percentage == expected_percent
     assert bar._color == HEALTH.colors[expected_color_index][1]
@@ -1,125 +1,77 @@
+from collections.abc import Generator
 from unittest.mock import Mock, patch
 
 import pygame
 import pytest
 
-from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.components.home_view import HomeView
-
-
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
-def test_home_view_initialization():
+from tests.presentation.components.conftest import evt
+
+_CALLBACK_NAMES = (
+    "on_char",
+    "on_deck",
+    "on_contracts",
+    "on_build",
+    "on_shop",
+    "on_transfer",
+    "on_projects",
+)
+
+
+@pytest.fixture(scope="module")
+def home_view(
+    module_font: Mock,
+    module_button: Mock,
+) -> Generator[tuple[HomeView, Mock, Mock, dict[str, Mock]]]:
+    """Builds a single HomeView with patched font and buttons for the module."""
+    callbacks = {name: Mock() for name in _CALLBACK_NAMES}
+    with patch(
+        "decker_pygame.presentation.components.home_view.Button"
+    ) as mock_button_class:
+        mock_button_class.return_value = module_button
+
+        view = HomeView(**callbacks)
+        yield view, module_font, mock_button_class, callbacks
+
+
+def test_home_view_initialization(
+    home_view: tuple[HomeView, Mock, Mock, dict[str, Mock]],
+):
     """Tests that the HomeView initializes and creates its buttons."""
-    mock_on_char = Mock()
-    mock_on_deck = Mock()
-    mock_on_contracts = Mock()
-    mock_on_build = Mock()
-    mock_on_shop = Mock()
-    mock_on_transfer = Mock()
-    mock_on_projects = Mock()
-
-    with (
-        patch("pygame.font.Font") as mock_font_class,
-        patch(
-            "decker_pygame.presentation.components.home_view.Button"
-        ) as mock_button_class,
-    ):
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((100, 20))
-        mock_font_instance.get_linesize.return_value = 20
-        mock_font_class.return_value = mock_font_instance
-
-        mock_button_instance = Mock(spec=Button)
-        mock_button_instance.image = pygame.Surface((10, 10))
-        mock_button_instance.rect = pygame.Rect(0, 0, 10, 10)
-        mock_button_class.return_value = mock_button_instance
-
-        view = HomeView(
-            on_char=mock_on_char,
-            on_deck=mock_on_deck,
-            on_contracts=mock_on_contracts,
-            on_build=mock_on_build,
-            on_shop=mock_on_shop,
-            on_transfer=mock_on_transfer,
-            on_projects=mock_on_projects,
-        )
-
-        assert view is not None
-        assert mock_font_instance.render.call_count == 1
-        assert mock_font_instance.render.call_args[0][0] == "Main Menu"
-
-        # 5 buttons should be created
-        assert mock_button_class.call_count == 7
-        button_calls = mock_button_class.call_args_list
-        button_texts = [call.args[2] for call in button_calls]
-        button_callbacks = [call.args[3] for call in button_calls]
-
-        assert "Character" in button_texts
-        assert "Deck" in button_texts
-        assert "Contracts" in button_texts
-        assert "Build" in button_texts
-        assert "Shop" in button_texts
-        assert "Transfer" in button_texts
-        assert "Projects" in button_texts
-
-        assert mock_on_char in button_callbacks
-        assert mock_on_deck in button_callbacks
-        assert mock_on_contracts in button_callbacks
-        assert mock_on_build in button_callbacks
-        assert mock_on_shop in button_callbacks
-        assert mock_on_transfer in button_callbacks
-        assert mock_on_projects in button_callbacks
-
-
-def test_home_view_event_handling():
+    view, mock_font_instance, mock_button_class, callbacks = home_view
+
+    assert view is not None
+    assert mock_font_instance.render.call_count == 1
+    assert mock_font_instance.render.call_args[0][0] == "Main Menu"
+
+    # One button per menu entry
+    assert mock_button_class.call_count == 7
+    button_calls = mock_button_class.call_args_list
+    button_texts = {call.args[2] for call in button_calls}
+    button_callbacks = {call.args[3] for call in button_calls}
+
+    assert {
+        "Character",
+        "Deck",
+        "Contracts",
+        "Build",
+        "Shop",
+        "Transfer",
+        "Projects",
+    } <= button_texts
+    assert set(callbacks.values()) <= button_callbacks
+
+
+def test_home_view_event_handling(
+    home_view: tuple[HomeView, Mock, Mock, dict[str, Mock]],
+):
     """Tests that the view correctly delegates events to its components."""
-    mock_on_char = Mock()
-    mock_on_deck = Mock()
-    mock_on_contracts = Mock()
-    mock_on_build = Mock()
-    mock_on_shop = Mock()
-    mock_on_transfer = Mock()
-    mock_on_projects = Mock()
-
-    with (
-        patch("pygame.font.Font") as mock_font_class,
-        patch(
-            "decker_pygame.presentation.components.home_view.Button"
-        ) as mock_button_class,
-    ):
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((100, 20))
-        mock_font_instance.get_linesize.return_value = 20
-        mock_font_class.return_value = mock_font_instance
-
-        mock_button_instance = Mock(spec=Button)
-        mock_button_instance.image = pygame.Surface((10, 10))
-        mock_button_instance.rect = pygame.Rect(0, 0, 10, 10)
-        mock_button_class.return_value = mock_button_instance
-
-        view = HomeView(
-            on_char=mock_on_char,
-            on_deck=mock_on_deck,
-            on_contracts=mock_on_contracts,
-            on_build=mock_on_build,
-            on_shop=mock_on_shop,
-            on_transfer=mock_on_transfer,
-            on_projects=mock_on_projects,
-        )
-
-        # We can test the event delegation by checking if the button's method is called
-        with patch.object(
-            view._components.sprites()[0], "handle_event"
-        ) as mock_button_handler:
-            event = pygame.event.Event(
-                pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (0, 0)}
-            )
-            view.handle_event(event)
-            mock_button_handler.assert_called_once()
+    view = home_view[0]
+
+    # We can test the event delegation by checking if the button's method is called
+    with patch.object(
+        view._components.sprites()[0], "handle_event"
+    ) as mock_button_handler:
+        event = evt(pygame.MOUSEBUTTONDOWN, button=1, pos=(0, 0))
+        view.handle_event(event)
+        mock_button_handler.assert_called_once()
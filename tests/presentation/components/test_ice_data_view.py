@@ -1,24 +1,17 @@
-from unittest.mock import ANY, Mock, patch
+from unittest.mock import Mock
 
 import pygame
 import pytest
 
 from decker_pygame.application.dtos import IceDataViewDTO
 from decker_pygame.presentation.components.ice_data_view import IceDataView
+from tests.presentation.components.conftest import evt
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
-def test_ice_data_view_initialization_and_rendering():
-    """Tests that the IceDataView initializes and renders its data correctly."""
-    mock_on_close = Mock()
-    view_data = IceDataViewDTO(
+@pytest.fixture(scope="module")
+def ice_dto() -> IceDataViewDTO:
+    """Provides the IceDataViewDTO shared by the module's tests."""
+    return IceDataViewDTO(
         name="Black ICE",
         ice_type="Barrier",
         strength=8,
@@ -26,66 +19,55 @@ def test_ice_data_view_initialization_and_rendering():
         cost=2500,
     )
 
-    with (
-        patch("pygame.font.Font") as mock_font_class,
-        patch(
-            "decker_pygame.presentation.components.ice_data_view.Button"
-        ) as mock_button_class,
-    ):
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((100, 20))
-        mock_font_instance.get_linesize.return_value = 20
-        mock_font_class.return_value = mock_font_instance
-
-        view = IceDataView(data=view_data, on_close=mock_on_close)
-
-        assert view is not None
-        # Title + 4 data lines
-        assert mock_font_instance.render.call_count == 5
-        rendered_texts = {
-            call.args[0] for call in mock_font_instance.render.call_args_list
-        }
-        assert "Black ICE" in rendered_texts
-        assert "Type: Barrier" in rendered_texts
-        assert "Strength: 8" in rendered_texts
-        assert "Cost: $2500" in rendered_texts
-        assert "Description: A tough defensive program." in rendered_texts
 
-        mock_button_class.assert_called_once_with(
-            position=ANY, size=ANY, text="Close", on_click=mock_on_close
-        )
+@pytest.fixture(scope="module")
+def ice_data_view(
+    ice_dto: IceDataViewDTO, module_font: Mock
+) -> tuple[IceDataView, Mock, Mock]:
+    """Builds a single IceDataView with a real close button for the module.
 
-
-def test_ice_data_view_delegates_close_event():
-    """Tests that clicking the close button triggers the on_close callback."""
+    The patched font records the rendered strings and returns a real surface,
+    which the Button needs because it blits its rendered label.
+    """
     mock_on_close = Mock()
-    view_data = IceDataViewDTO(
-        name="Black ICE", ice_type="Barrier", strength=8, description="...", cost=2500
-    )
+    view = IceDataView(data=ice_dto, on_close=mock_on_close)
+    return view, module_font, mock_on_close
 
-    with patch("pygame.font.Font") as mock_font_class:
-        # Use a real button to test the click
-        # We must configure the mock font to return a real surface to avoid a
-        # TypeError when the Button tries to blit the rendered text.
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((10, 10))
-        mock_font_instance.get_linesize.return_value = 20
-        mock_font_class.return_value = mock_font_instance
-        view = IceDataView(data=view_data, on_close=mock_on_close)
 
-        close_button = view._close_button
-        click_pos = (
-            close_button.rect.centerx + view.rect.x,
-            close_button.rect.centery + view.rect.y,
-        )
-        down_event = pygame.event.Event(
-            pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": click_pos}
-        )
-        up_event = pygame.event.Event(
-            pygame.MOUSEBUTTONUP, {"button": 1, "pos": click_pos}
-        )
+def test_ice_data_view_initialization_and_rendering(
+    ice_data_view: tuple[IceDataView, Mock, Mock],
+):
+    """Tests that the IceDataView initializes and renders its data correctly."""
+    view, mock_font_instance, mock_on_close = ice_data_view
+
+    assert view is not None
+    rendered_texts = {call.args[0] for call in mock_font_instance.render.call_args_list}
+    # Title + 4 data lines + the close button's label
+    assert rendered_texts == {
+        "Black ICE",
+        "Type: Barrier",
+        "Strength: 8",
+        "Cost: $2500",
+        "Description: A tough defensive program.",
+        "Close",
+    }
+
+    assert view._close_button.text == "Close"
+    assert view._close_button._on_click is mock_on_close
+
+
+def test_ice_data_view_delegates_close_event(
+    ice_data_view: tuple[IceDataView, Mock, Mock],
+):
+    """Tests that clicking the close button triggers the on_close callback."""
+    view, _, mock_on_close = ice_data_view
 
-        view.handle_event(down_event)
-        view.handle_event(up_event)
+    close_button = view._close_button
+    click_pos = (
+        close_button.rect.centerx + view.rect.x,
+        close_button.rect.centery + view.rect.y,
+    )
+    view.handle_event(evt(pygame.MOUSEBUTTONDOWN, button=1, pos=click_pos))
+    view.handle_event(evt(pygame.MOUSEBUTTONUP, button=1, pos=click_pos))
 
-        mock_on_close.assert_called_once()
+    mock_on_close.assert_called_once()
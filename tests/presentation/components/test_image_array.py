@@ -1,24 +1,15 @@
+from unittest.mock import patch
+
 import pygame
 import pytest
 
 from decker_pygame.presentation.components.image_array import ImageArray
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
 @pytest.fixture
 def image_list() -> list[pygame.Surface]:
-    """Provides a list of mock surfaces for testing."""
-    images = [pygame.Surface((10, 20)), pygame.Surface((30, 40))]
-    images[0].fill((255, 0, 0))  # Red
-    images[1].fill((0, 255, 0))  # Green
-    return images
+    """Provides a list of distinct surfaces; tests only check their identity."""
+    return [pygame.Surface((1, 1), 0, 8), pygame.Surface((1, 1), 0, 8)]
 
 
 def test_initialization(image_list: list[pygame.Surface]):
@@ -45,10 +36,12 @@ def test_set_image(image_list: list[pygame.Surface]):
     assert img_array._current_index == 1
 
 
-def test_set_image_invalid_index(image_list: list[pygame.Surface], capsys):
+def test_set_image_invalid_index(image_list: list[pygame.Surface]):
     """Tests that an invalid index does not change the image and prints a warning."""
     img_array = ImageArray(position=(50, 60), images=image_list)
 
-    img_array.set_image(99)
+    with patch("builtins.print") as mock_print:
+        img_array.set_image(99)
+
     assert img_array.image is image_list[0]  # Should not change
-    assert "Warning: Invalid index 99" in capsys.readouterr().out
+    mock_print.assert_called_once_with("Warning: Invalid index 99 for ImageArray.")
@@ -1,21 +1,12 @@
 import pygame
-import pytest
 
 from decker_pygame.presentation.components.image_display import ImageDisplay
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
 def test_initialization():
     """Tests that the ImageDisplay initializes with the correct image and position."""
-    test_image = pygame.Surface((50, 60))
-    test_image.fill((255, 0, 255))  # Fill with a distinct color
+    # 8-bit and unfilled: only the identity and size of the image are checked.
+    test_image = pygame.Surface((50, 60), 0, 8)
 
     display = ImageDisplay(position=(10, 20), image=test_image)
 
@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pygame
@@ -6,12 +7,13 @@ import pytest
 from decker_pygame.presentation.components.list_view import ListView
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
+def _click(pos: tuple[int, int]) -> SimpleNamespace:
+    """Builds a left-button MOUSEBUTTONDOWN stand-in at the given position.
+
+    ListView only reads ``type``, ``button`` and ``pos``, so a plain namespace
+    is enough and avoids wrapping a real SDL event.
+    """
+    return SimpleNamespace(type=pygame.MOUSEBUTTONDOWN, button=1, pos=pos)
 
 
 @pytest.fixture
@@ -37,6 +39,19 @@ def list_view_instance(mock_on_selection_change):
     return ListView((0, 0), (200, 150), columns, mock_on_selection_change)
 
 
+@pytest.fixture
+def selected_list_view(list_view_instance, sample_list_data, mock_on_selection_change):
+    """Provides a populated ListView with the first item already selected."""
+
+    def item_renderer(item):
+        return [item["name"], str(item["value"])]
+
+    list_view_instance.set_items(sample_list_data, item_renderer)
+    list_view_instance.handle_event(_click(list_view_instance._item_rects[0].center))
+    mock_on_selection_change.reset_mock()
+    return list_view_instance
+
+
 def test_list_view_initialization(list_view_instance):
     """Tests that the ListView initializes correctly."""
     assert list_view_instance.rect.size == (200, 150)
@@ -62,8 +77,7 @@ def test_set_items_renders_items_and_resets_selection(
 
     # Verify that item rects are created (implies rendering)
     assert len(list_view_instance._item_rects) == len(sample_list_data)
-    for rect in list_view_instance._item_rects:
-        assert isinstance(rect, pygame.Rect)
+    assert all(type(rect) is pygame.Rect for rect in list_view_instance._item_rects)
 
 
 def test_handle_event_selects_item(
@@ -82,7 +96,7 @@ def test_handle_event_selects_item(
     # Simulate click on the first item
     first_item_rect = list_view_instance._item_rects[0]
     click_pos = first_item_rect.center
-    event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": click_pos})
+    event = _click(click_pos)
     list_view_instance.handle_event(event)
 
     assert list_view_instance._selected_index == 0
@@ -90,129 +104,64 @@ def test_handle_event_selects_item(
 
 
 def test_handle_event_changes_selection(
-    list_view_instance, sample_list_data, mock_on_selection_change
+    selected_list_view, sample_list_data, mock_on_selection_change
 ):
     """
     Tests that clicking a different item changes the selection.
     """
-
-    def item_renderer(item):
-        return [item["name"], str(item["value"])]
-
-    list_view_instance.set_items(sample_list_data, item_renderer)
-    mock_on_selection_change.reset_mock()
-
-    # Select first item
-    first_item_rect = list_view_instance._item_rects[0]
-    event = pygame.event.Event(
-        pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": first_item_rect.center}
-    )
-    list_view_instance.handle_event(event)
-    mock_on_selection_change.reset_mock()
-
     # Select second item
-    second_item_rect = list_view_instance._item_rects[1]
-    event = pygame.event.Event(
-        pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": second_item_rect.center}
-    )
-    list_view_instance.handle_event(event)
+    second_item_rect = selected_list_view._item_rects[1]
+    event = _click(second_item_rect.center)
+    selected_list_view.handle_event(event)
 
-    assert list_view_instance._selected_index == 1
+    assert selected_list_view._selected_index == 1
     mock_on_selection_change.assert_called_once_with(sample_list_data[1])
 
 
 def test_handle_event_deselects_item_on_click_outside_item(
-    list_view_instance, sample_list_data, mock_on_selection_change
+    selected_list_view, mock_on_selection_change
 ):
     """
     Tests that clicking outside an item (but within the list view) deselects it.
     """
-
-    def item_renderer(item):
-        return [item["name"], str(item["value"])]
-
-    list_view_instance.set_items(sample_list_data, item_renderer)
-    mock_on_selection_change.reset_mock()
-
-    # Select first item
-    first_item_rect = list_view_instance._item_rects[0]
-    event = pygame.event.Event(
-        pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": first_item_rect.center}
-    )
-    list_view_instance.handle_event(event)
-    mock_on_selection_change.reset_mock()
-
     # Click within the list view but not on any item (e.g., below the last item)
     click_pos = (
-        list_view_instance.rect.x + 10,
-        list_view_instance.rect.y + list_view_instance.rect.height - 5,
+        selected_list_view.rect.x + 10,
+        selected_list_view.rect.y + selected_list_view.rect.height - 5,
     )
-    event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": click_pos})
-    list_view_instance.handle_event(event)
+    event = _click(click_pos)
+    selected_list_view.handle_event(event)
 
-    assert list_view_instance._selected_index is None
+    assert selected_list_view._selected_index is None
     mock_on_selection_change.assert_called_once_with(None)
 
 
 def test_handle_event_no_change_on_click_same_item(
-    list_view_instance, sample_list_data, mock_on_selection_change
+    selected_list_view, mock_on_selection_change
 ):
     """
     Tests that clicking the same item does not trigger a selection change callback.
     """
+    # Click the already-selected first item again
+    selected_list_view.handle_event(_click(selected_list_view._item_rects[0].center))
 
-    def item_renderer(item):
-        return [item["name"], str(item["value"])]
-
-    list_view_instance.set_items(sample_list_data, item_renderer)
-    mock_on_selection_change.reset_mock()
-
-    # Select first item
-    first_item_rect = list_view_instance._item_rects[0]
-    event = pygame.event.Event(
-        pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": first_item_rect.center}
-    )
-    list_view_instance.handle_event(event)
-    mock_on_selection_change.reset_mock()
-
-    # Click the same item again
-    event = pygame.event.Event(
-        pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": first_item_rect.center}
-    )
-    list_view_instance.handle_event(event)
-
-    assert list_view_instance._selected_index == 0
+    assert selected_list_view._selected_index == 0
     mock_on_selection_change.assert_not_called()
 
 
 def test_handle_event_no_change_on_click_outside_list_view(
-    list_view_instance, sample_list_data, mock_on_selection_change
+    selected_list_view, mock_on_selection_change
 ):
     """
     Tests that clicking outside the list view does not affect selection.
     """
-
-    def item_renderer(item):
-        return [item["name"], str(item["value"])]
-
-    list_view_instance.set_items(sample_list_data, item_renderer)
-    mock_on_selection_change.reset_mock()
-
-    # Select first item
-    first_item_rect = list_view_instance._item_rects[0]
-    event = pygame.event.Event(
-        pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": first_item_rect.center}
-    )
-    list_view_instance.handle_event(event)
-    mock_on_selection_change.reset_mock()
-
     # Click outside the list view
     click_pos = (
-        list_view_instance.rect.x + list_view_instance.rect.width + 10,
-        list_view_instance.rect.y + 10,
+        selected_list_view.rect.x + selected_list_view.rect.width + 10,
+        selected_list_view.rect.y + 10,
     )
-    event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": click_pos})
-    list_view_instance.handle_event(event)
+    event = _click(click_pos)
+    selected_list_view.handle_event(event)
 
-    assert list_view_instance._selected_index == 0  # Selection should remain unchanged
+    assert selected_list_view._selected_index == 0  # Selection should remain unchanged
     mock_on_selection_change.assert_not_called()
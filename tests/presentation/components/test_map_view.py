@@ -1,3 +1,5 @@
+from unittest.mock import ANY, Mock
+
 import pygame
 import pytest
 
@@ -5,14 +7,6 @@ from decker_pygame.presentation.components.map_view import MapView
 from decker_pygame.settings import MAP_VIEW
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
 @pytest.fixture
 def map_data():
     """Provides sample node and connection data for map tests."""
@@ -21,22 +15,28 @@ def map_data():
     return nodes, connections
 
 
-def test_map_view_rendering(map_data):
-    """Tests that the MapView correctly renders nodes and connections."""
+def test_map_view_rendering(map_data, monkeypatch: pytest.MonkeyPatch):
+    """Tests that the MapView draws every node and each valid connection."""
     nodes, connections = map_data
+    mock_line = Mock(wraps=pygame.draw.line)
+    mock_circle = Mock(wraps=pygame.draw.circle)
+    monkeypatch.setattr(pygame.draw, "line", mock_line)
+    monkeypatch.setattr(pygame.draw, "circle", mock_circle)
+
     view = MapView(
         position=(0, 0), size=(200, 150), nodes=nodes, connections=connections
     )
 
-    # Check that a pixel at a node's center has the node color
-    assert view.image.get_at(nodes["A"]) == MAP_VIEW.node_color
-    assert view.image.get_at(nodes["B"]) == MAP_VIEW.node_color
-    assert view.image.get_at(nodes["C"]) == MAP_VIEW.node_color
-
-    # Check that a pixel on the line has the line color
-    mid_x = (nodes["A"][0] + nodes["B"][0]) // 2
-    mid_y = (nodes["A"][1] + nodes["B"][1]) // 2
-    assert view.image.get_at((mid_x, mid_y)) == MAP_VIEW.line_color
-
-    # Check that a pixel on the background has the background color
-    assert view.image.get_at((1, 1)) == MAP_VIEW.background_color
+    mock_line.assert_called_once_with(
+        view.image,
+        MAP_VIEW.line_color,
+        nodes["A"],
+        nodes["B"],
+        MAP_VIEW.line_width,
+    )
+    assert mock_circle.call_count == 3
+    drawn_centers = [call.args[2] for call in mock_circle.call_args_list]
+    assert drawn_centers == list(nodes.values())
+    mock_circle.assert_called_with(
+        view.image, MAP_VIEW.node_color, ANY, MAP_VIEW.node_radius
+    )
@@ -1,6 +1,7 @@
 """Tests for the MatrixRunView component."""
 
-from unittest.mock import Mock, patch
+from collections.abc import Generator
+from unittest.mock import MagicMock, Mock, patch
 
 import pygame
 import pytest
@@ -9,38 +10,81 @@ from decker_pygame.application.dtos import MatrixRunViewDTO
 from decker_pygame.presentation.asset_service import AssetService
 from decker_pygame.presentation.components.matrix_run_view import MatrixRunView
 
+# Real surfaces are needed because they reach pygame functions, but the view only
+# copies or blits them, so one allocation per module is enough.
+_BACKGROUND = pygame.Surface((1024, 768))
+_SPRITESHEET = [pygame.Surface((16, 16))]
+
+# Child components that MatrixRunView.update pushes DTO data into.
+_CHILD_NAMES = (
+    "clock_view",
+    "alarm_bar",
+    "physical_health_bar",
+    "mental_health_bar",
+    "deck_health_bar",
+    "shield_status_bar",
+    "transfer_progress_bar",
+    "trace_progress_bar",
+    "ice_health_bar",
+    "software_list_view",
+    "message_view",
+    "map_view",
+)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def isolate_background_cache() -> Generator[None]:
+    """Starts the module with an empty MatrixRunView._background cache.
+
+    The background loaded by the first view is then reused by the rest of the
+    module, and the original cache is restored afterwards.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(MatrixRunView, "_background", None)
+        yield
 
-@pytest.fixture(autouse=True)
-def pygame_init_fixture():
-    """Fixture to initialize pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
+
+@pytest.fixture
+def reset_matrix_run_view_background(monkeypatch: pytest.MonkeyPatch):
+    """Clears the MatrixRunView._background cache for tests of the first load."""
+    monkeypatch.setattr(MatrixRunView, "_background", None)
 
 
-@pytest.fixture(autouse=True)
-def reset_matrix_run_view_background():
-    """Ensures the MatrixRunView._background is reset for each test."""
-    original_background = MatrixRunView._background
-    MatrixRunView._background = None
-    yield
-    MatrixRunView._background = original_background
+@pytest.fixture(scope="module")
+def asset_service_spec() -> Mock:
+    """Builds the spec'd AssetService mock once for the module."""
+    return Mock(spec=AssetService)
 
 
 @pytest.fixture
-def mock_asset_service() -> Mock:
-    """Provides a mock AssetService."""
-    service = Mock(spec=AssetService)
-    # Configure it to return real surfaces, as they are passed to pygame functions
-    # that expect them.
-    service.get_spritesheet.return_value = [pygame.Surface((16, 16))]
-    service.get_image.return_value = pygame.Surface((1024, 768))
+def mock_asset_service(asset_service_spec: Mock) -> Mock:
+    """Provides the module's mock AssetService, reset for each test."""
+    service = asset_service_spec
+    service.reset_mock(return_value=True, side_effect=True)
+    service.get_spritesheet.return_value = _SPRITESHEET
+    service.get_image.return_value = _BACKGROUND
     return service
 
 
-def test_matrix_run_view_initialization(mock_asset_service: Mock):
+@pytest.fixture(scope="module")
+def shared_view(module_font: Mock) -> Generator[tuple[MatrixRunView, Mock]]:
+    """Builds one MatrixRunView for the tests that leave it unchanged.
+
+    The view gets its own AssetService mock because ``mock_asset_service`` is
+    reset for every test. The class cache is emptied first, so this view always
+    performs a first background load, whichever tests ran before it.
+    """
+    service = Mock(spec=AssetService)
+    service.get_spritesheet.return_value = _SPRITESHEET
+    service.get_image.return_value = _BACKGROUND
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(MatrixRunView, "_background", None)
+        yield MatrixRunView(asset_service=service), service
+
+
+def test_matrix_run_view_initialization(shared_view: tuple[MatrixRunView, Mock]):
     """Tests that the view initializes its HUD components."""
-    view = MatrixRunView(asset_service=mock_asset_service)
+    view, mock_asset_service = shared_view
     # Check that the child views were created and added
     assert view.node_grid_view is not None
     assert view.map_view is not None
@@ -80,47 +124,37 @@ def test_matrix_run_view_update(mock_asset_service: Mock):
         connections=[("a", "b")],
     )
 
-    # Spy on the child components' update methods
-    with (
-        patch.object(view.clock_view, "update_time") as mock_clock_update,
-        patch.object(view.alarm_bar, "set_percentage") as mock_alarm_update,
-        patch.object(view.physical_health_bar, "set_percentage") as mock_phys_update,
-        patch.object(view.mental_health_bar, "set_percentage") as mock_ment_update,
-        patch.object(view.deck_health_bar, "set_percentage") as mock_deck_update,
-        patch.object(view.shield_status_bar, "set_percentage") as mock_shield_update,
-        patch.object(view.transfer_progress_bar, "set_percentage") as mock_trans_update,
-        patch.object(view.trace_progress_bar, "set_percentage") as mock_trace_update,
-        patch.object(view.ice_health_bar, "set_percentage") as mock_ice_update,
-        patch.object(view.software_list_view, "set_software") as mock_software_update,
-        patch.object(view.message_view, "set_text") as mock_message_update,
-        patch.object(view.map_view, "update_map") as mock_map_update,
-        patch.object(view.components, "update") as mock_group_update,
-        patch.object(view.components, "draw") as mock_draw,
-    ):
-        view.update(test_data)
+    # Swap the child components for mocks so their calls can be asserted directly
+    for name in _CHILD_NAMES:
+        setattr(view, name, MagicMock())
+    view.components = MagicMock(spec=pygame.sprite.Group)
+
+    view.update(test_data)
+
+    # Assert that each component was updated with the correct data from the DTO
+    view.clock_view.update_time.assert_called_once_with(123)
+    view.alarm_bar.set_percentage.assert_called_once_with(50.0)
+    view.physical_health_bar.set_percentage.assert_called_once_with(75.0)
+    view.mental_health_bar.set_percentage.assert_called_once_with(80.0)
+    view.deck_health_bar.set_percentage.assert_called_once_with(90.0)
+    view.shield_status_bar.set_percentage.assert_called_once_with(25.0)
+    view.transfer_progress_bar.set_percentage.assert_called_once_with(10.0)
+    view.trace_progress_bar.set_percentage.assert_called_once_with(5.0)
+    view.ice_health_bar.set_percentage.assert_called_once_with(60.0)
+    view.software_list_view.set_software.assert_called_once_with(
+        ["TestProgram1", "TestProgram2"]
+    )
+    view.message_view.set_text.assert_called_once_with("Message 1\nMessage 2")
+    view.map_view.update_map.assert_called_once_with({"a": (1, 1)}, [("a", "b")])
 
-        # Assert that each component was updated with the correct data from the DTO
-        mock_clock_update.assert_called_once_with(123)
-        mock_alarm_update.assert_called_once_with(50.0)
-        mock_phys_update.assert_called_once_with(75.0)
-        mock_ment_update.assert_called_once_with(80.0)
-        mock_deck_update.assert_called_once_with(90.0)
-        mock_shield_update.assert_called_once_with(25.0)
-        mock_trans_update.assert_called_once_with(10.0)
-        mock_trace_update.assert_called_once_with(5.0)
-        mock_ice_update.assert_called_once_with(60.0)
-        mock_software_update.assert_called_once_with(["TestProgram1", "TestProgram2"])
-        mock_message_update.assert_called_once_with("Message 1\nMessage 2")
-        mock_map_update.assert_called_once_with({"a": (1, 1)}, [("a", "b")])
-
-        # Assert that the main sprite group methods were called
-        mock_group_update.assert_called_once()
-        mock_draw.assert_called_once()
-
-
-def test_matrix_run_view_update_no_messages(mock_asset_service: Mock):
+    # Assert that the main sprite group methods were called
+    view.components.update.assert_called_once()
+    view.components.draw.assert_called_once_with(view.image)
+
+
+def test_matrix_run_view_update_no_messages(shared_view: tuple[MatrixRunView, Mock]):
     """Tests that the message view falls back to the run time if no messages."""
-    view = MatrixRunView(asset_service=mock_asset_service)
+    view, _ = shared_view
 
     # DTO with no messages
     test_data = MatrixRunViewDTO(
@@ -136,6 +170,7 @@ def test_matrix_run_view_update_no_messages(mock_asset_service: Mock):
         mock_message_update.assert_called_once_with(expected_time_string)
 
 
+@pytest.mark.usefixtures("reset_matrix_run_view_background")
 def test_matrix_run_view_raises_error_if_background_missing(mock_asset_service: Mock):
     """Tests that MatrixRunView raises a ValueError if background is not found."""
     # Configure the mock to simulate the image being missing
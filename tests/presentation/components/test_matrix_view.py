@@ -1,18 +1,9 @@
 import pygame
-import pytest
 
 from decker_pygame.presentation.components.image_display import ImageDisplay
 from decker_pygame.presentation.components.matrix_view import MatrixView
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
 def test_matrix_view_initialization():
     """Tests that the MatrixView initializes with a background."""
     bg_color = pygame.Color("blue")
@@ -1,5 +1,4 @@
-from collections.abc import Generator
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pygame
 import pytest
@@ -7,19 +6,6 @@ import pytest
 from decker_pygame.presentation.components.message_view import MessageView
 
 
-@pytest.fixture
-def mock_font() -> Generator[Mock]:
-    """Provides a mock pygame.font.Font instance with a predictable size method."""
-    with patch("pygame.font.Font") as mock_font_class:
-        mock_font_instance = Mock()
-        # Make size() return the length of the string * 10 for width
-        mock_font_instance.size.side_effect = lambda text: (len(text) * 10, 15)
-        mock_font_instance.get_linesize.return_value = 18
-        mock_font_instance.render.return_value = pygame.Surface((10, 10))
-        mock_font_class.return_value = mock_font_instance
-        yield mock_font_instance
-
-
 def test_message_view_initialization(mock_font: Mock):
     """Tests that the MessageView initializes correctly."""
     bg_color = pygame.Color("black")
@@ -40,10 +26,12 @@ def test_message_view_word_wrapping(mock_font: Mock):
     view.set_text(text_to_render)
 
     # Check that font.render was called with the expected wrapped lines.
-    rendered_lines = [call.args[0] for call in mock_font.render.call_args_list]
-    assert rendered_lines[0] == "This is a very long"
-    assert rendered_lines[1] == "message to test the"
-    assert rendered_lines[2] == "wrapping."
+    rendered_lines = tuple(call.args[0] for call in mock_font.render.call_args_list)
+    assert rendered_lines[:3] == (
+        "This is a very long",
+        "message to test the",
+        "wrapping.",
+    )
 
 
 def test_message_view_handles_unbreakable_words(mock_font: Mock):
@@ -58,9 +46,8 @@ def test_message_view_handles_unbreakable_words(mock_font: Mock):
     view.set_text(text_to_render)
 
     # Check that font.render was called with the expected wrapped lines.
-    rendered_lines = [call.args[0] for call in mock_font.render.call_args_list]
-    assert rendered_lines[0] == "A_very_long_unbreak"
-    assert rendered_lines[1] == "able_word"
+    rendered_lines = tuple(call.args[0] for call in mock_font.render.call_args_list)
+    assert rendered_lines[:2] == ("A_very_long_unbreak", "able_word")
 
 
 def test_message_view_font_fallback_to_sysfont(mocker):
@@ -100,3 +87,16 @@ def test_message_view_font_fallback_to_dummy(mocker):
     # Check if it has the methods of our _DummyFont
     assert hasattr(view.font, "get_linesize")
     assert hasattr(view.font, "render")
+
+
+def test_message_view_initializes_font_module_when_needed(
+    mock_font: Mock, monkeypatch: pytest.MonkeyPatch
+):
+    """Tests that the view initializes pygame.font itself if nobody else has."""
+    font_init = Mock()
+    monkeypatch.setattr(pygame.font, "get_init", lambda: False)
+    monkeypatch.setattr(pygame.font, "init", font_init)
+
+    MessageView(position=(0, 0), size=(200, 100), background_color=(0, 0, 0))
+
+    font_init.assert_called_once_with()
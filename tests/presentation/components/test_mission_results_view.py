@@ -4,164 +4,97 @@ import pygame
 import pytest
 
 from decker_pygame.application.dtos import MissionResultsDTO
-from decker_pygame.presentation.components.button import Button
+from decker_pygame.presentation.components import mission_results_view
 from decker_pygame.presentation.components.mission_results_view import (
     MissionResultsView,
 )
 
+_SUCCESS_DATA = MissionResultsDTO(
+    contract_name="Data Heist",
+    was_successful=True,
+    credits_earned=5000,
+    reputation_change=1,
+)
+_FAILURE_DATA = MissionResultsDTO(
+    contract_name="Corp Infiltration",
+    was_successful=False,
+    credits_earned=0,
+    reputation_change=-1,
+)
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
-@pytest.fixture
-def success_data():
-    return MissionResultsDTO(
-        contract_name="Data Heist",
-        was_successful=True,
-        credits_earned=5000,
-        reputation_change=1,
-    )
+# The views never mutate incoming events, so one instance serves every test.
+_CLICK_EVENT = pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (0, 0)})
 
 
 @pytest.fixture
-def failure_data():
-    return MissionResultsDTO(
-        contract_name="Corp Infiltration",
-        was_successful=False,
-        credits_earned=0,
-        reputation_change=-1,
-    )
-
-
-def test_mission_results_view_initialization_success(success_data):
-    """Tests that the view initializes and renders success data correctly."""
-    mock_on_close = Mock()
-
-    with (
-        patch("pygame.font.Font") as mock_font_class,
-        patch(
-            "decker_pygame.presentation.components.mission_results_view.Button"
-        ) as mock_button_class,
-    ):
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((100, 20))
-        mock_font_instance.get_linesize.return_value = 20
-        mock_font_class.return_value = mock_font_instance
-
-        mock_button_instance = Mock(spec=Button)
-        mock_button_instance.image = pygame.Surface((10, 10))
-        mock_button_instance.rect = pygame.Rect(0, 0, 10, 10)
-        mock_button_class.return_value = mock_button_instance
-
-        view = MissionResultsView(data=success_data, on_close=mock_on_close)
-
-        assert view is not None
-        # Title + 4 lines of data
-        assert mock_font_instance.render.call_count == 5
-        render_calls = mock_font_instance.render.call_args_list
-        rendered_texts = [call.args[0] for call in render_calls]
-
-        assert "Status: Success" in rendered_texts
-        assert "Reputation Change: +1" in rendered_texts
+def mock_button_class(monkeypatch: pytest.MonkeyPatch, mock_button: Mock) -> Mock:
+    """Patches the view's Button class so it builds the shared mock button."""
+    mock_button_class = Mock(return_value=mock_button)
+    monkeypatch.setattr(mission_results_view, "Button", mock_button_class)
+    return mock_button_class
+
+
+@pytest.mark.parametrize(
+    "data, expected_status, expected_rep",
+    [
+        (_SUCCESS_DATA, "Status: Success", "Reputation Change: +1"),
+        (_FAILURE_DATA, "Status: Failure", "Reputation Change: -1"),
+    ],
+    ids=["success", "failure"],
+)
+def test_mission_results_view_initialization(
+    data: MissionResultsDTO,
+    expected_status: str,
+    expected_rep: str,
+    mock_button_class: Mock,
+    mock_font: Mock,
+):
+    """Tests that the view initializes and renders the mission results."""
 
-        mock_button_class.assert_called_once()
+    view = MissionResultsView(data=data, on_close=Mock())
 
+    assert view is not None
+    # Title + 4 lines of data
+    assert mock_font.render.call_count == 5
+    render_calls = mock_font.render.call_args_list
+    rendered_texts = [call.args[0] for call in render_calls]
 
-def test_mission_results_view_initialization_failure(failure_data):
-    """Tests that the view initializes and renders failure data correctly."""
-    mock_on_close = Mock()
+    assert expected_status in rendered_texts
+    assert expected_rep in rendered_texts
 
-    with (
-        patch("pygame.font.Font") as mock_font_class,
-        patch("decker_pygame.presentation.components.mission_results_view.Button"),
-    ):
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((100, 20))
-        mock_font_instance.get_linesize.return_value = 20
-        mock_font_class.return_value = mock_font_instance
+    mock_button_class.assert_called_once()
 
-        MissionResultsView(data=failure_data, on_close=mock_on_close)
 
-        render_calls = mock_font_instance.render.call_args_list
-        rendered_texts = [call.args[0] for call in render_calls]
+def test_mission_results_view_event_handling(mock_button_class: Mock, mock_font: Mock):
+    """Tests that the view correctly delegates events to its components."""
+    view = MissionResultsView(data=_SUCCESS_DATA, on_close=Mock())
 
-        assert "Status: Failure" in rendered_texts
-        assert "Reputation Change: -1" in rendered_texts
+    with patch.object(
+        view._components.sprites()[0], "handle_event"
+    ) as mock_button_handler:
+        view.handle_event(_CLICK_EVENT)
+        mock_button_handler.assert_called_once()
 
 
-def test_mission_results_view_event_handling(success_data):
-    """Tests that the view correctly delegates events to its components."""
-    mock_on_close = Mock()
-
-    with (
-        patch("pygame.font.Font") as mock_font_class,
-        patch(
-            "decker_pygame.presentation.components.mission_results_view.Button"
-        ) as mock_button_class,
-    ):
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((100, 20))
-        mock_font_instance.get_linesize.return_value = 20
-        mock_font_class.return_value = mock_font_instance
-
-        mock_button_instance = Mock(spec=Button)
-        mock_button_instance.image = pygame.Surface((10, 10))
-        mock_button_instance.rect = pygame.Rect(0, 0, 10, 10)
-        mock_button_class.return_value = mock_button_instance
-
-        view = MissionResultsView(data=success_data, on_close=mock_on_close)
-
-        with patch.object(
-            view._components.sprites()[0], "handle_event"
-        ) as mock_button_handler:
-            event = pygame.event.Event(
-                pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": (0, 0)}
-            )
-            view.handle_event(event)
-            mock_button_handler.assert_called_once()
-
-
-def test_mission_results_view_mouse_up_converts_coords(success_data):
+def test_mission_results_view_mouse_up_converts_coords(
+    mock_button: Mock, mock_button_class: Mock, mock_font: Mock
+):
     """Ensure MOUSEBUTTONUP events are converted to local component coords.
 
     This exercises the MOUSEBUTTONUP branch in handle_event and ensures the
     delegated event uses coordinates local to the view's surface.
     """
-    mock_on_close = Mock()
-
-    with (
-        patch("pygame.font.Font") as mock_font_class,
-        patch(
-            "decker_pygame.presentation.components.mission_results_view.Button"
-        ) as mock_button_class,
-    ):
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((100, 20))
-        mock_font_instance.get_linesize.return_value = 20
-        mock_font_class.return_value = mock_font_instance
-
-        mock_button_instance = Mock(spec=Button)
-        mock_button_instance.image = pygame.Surface((10, 10))
-        mock_button_instance.rect = pygame.Rect(0, 0, 10, 10)
-        mock_button_instance.handle_event = Mock()
-        mock_button_class.return_value = mock_button_instance
-
-        view = MissionResultsView(data=success_data, on_close=mock_on_close)
-
-        # Create an absolute position that lies within the view's rect and
-        # ensure the delegated event receives local coordinates.
-        abs_pos = (view.rect.x + 5, view.rect.y + 6)
-        event = pygame.event.Event(pygame.MOUSEBUTTONUP, {"button": 1, "pos": abs_pos})
-
-        view.handle_event(event)
-
-        # Called once and the passed event should have local coordinates
-        mock_button_instance.handle_event.assert_called_once()
-        delegated_event = mock_button_instance.handle_event.call_args[0][0]
-        assert hasattr(delegated_event, "pos")
-        assert delegated_event.pos == (5, 6)
+    view = MissionResultsView(data=_SUCCESS_DATA, on_close=Mock())
+
+    # Create an absolute position that lies within the view's rect and
+    # ensure the delegated event receives local coordinates.
+    abs_pos = (view.rect.x + 5, view.rect.y + 6)
+    event = pygame.event.Event(pygame.MOUSEBUTTONUP, {"button": 1, "pos": abs_pos})
+
+    view.handle_event(event)
+
+    # Called once and the passed event should have local coordinates
+    mock_button.handle_event.assert_called_once()
+    delegated_event = mock_button.handle_event.call_args[0][0]
+    assert hasattr(delegated_event, "pos")
+    assert delegated_event.pos == (5, 6)
@@ -1,30 +1,8 @@
-from collections.abc import Generator
-from unittest.mock import Mock, patch
-
-import pygame
-import pytest
+from unittest.mock import Mock
 
 from decker_pygame.presentation.components.name_bar import NameBar
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
-@pytest.fixture
-def mock_font() -> Generator[Mock]:
-    """Provides a mock pygame.font.Font instance."""
-    with patch("pygame.font.Font") as mock_font_class:
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((100, 20))
-        mock_font_class.return_value = mock_font_instance
-        yield mock_font_instance
-
-
 def test_initialization(mock_font: Mock):
     """Tests that the NameBar initializes and renders its initial text."""
     view = NameBar(position=(10, 10), initial_text="Decker")
@@ -1,47 +1,37 @@
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pygame
 import pytest
 
-from decker_pygame.presentation.components.button import Button
+from decker_pygame.presentation.components import new_char_view as new_char_view_module
 from decker_pygame.presentation.components.new_char_view import NewCharView
 from decker_pygame.presentation.components.text_input import TextInput
+from tests.presentation.surfaces import DUMMY_SURFACE
 
+# TextInput spec introspection happens once, when the module is imported. It must
+# stay a spec'd Mock (not a plain namespace) so sprite Groups accept it.
+_TEXT_INPUT_PROTO = Mock(spec=TextInput)
+_TEXT_INPUT_PROTO.image = DUMMY_SURFACE
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    pygame.init()
-    yield
-    pygame.quit()
+# The view never mutates incoming events, so one instance serves every test.
+_CLICK_EVENT = pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"pos": (10, 10)})
 
 
 @pytest.fixture
-def new_char_view():
+def new_char_view(monkeypatch: pytest.MonkeyPatch, mock_button: Mock, mock_font: Mock):
     mock_on_create = Mock()
-    with (
-        patch("pygame.font.Font") as mock_font_class,
-        patch(
-            "decker_pygame.presentation.components.new_char_view.TextInput"
-        ) as mock_text_input_class,
-        patch(
-            "decker_pygame.presentation.components.new_char_view.Button"
-        ) as mock_button_class,
-    ):
-        mock_font_class.return_value.render.return_value = pygame.Surface((10, 10))
-
-        mock_text_input_instance = Mock(spec=TextInput)
-        mock_text_input_instance.image = pygame.Surface((10, 10))
-        mock_text_input_instance.rect = pygame.Rect(0, 0, 10, 10)
-        mock_text_input_instance.text = "TestName"
-        mock_text_input_class.return_value = mock_text_input_instance
-
-        mock_button_instance = Mock(spec=Button)
-        mock_button_instance.image = pygame.Surface((10, 10))
-        mock_button_instance.rect = pygame.Rect(0, 0, 10, 10)
-        mock_button_class.return_value = mock_button_instance
-
-        view = NewCharView(on_create=mock_on_create)
-        yield view, mock_on_create, mock_text_input_instance, mock_button_instance
+    mock_text_input_instance = _TEXT_INPUT_PROTO
+    mock_text_input_instance.reset_mock()
+    mock_text_input_instance.rect = pygame.Rect(0, 0, 10, 10)
+    mock_text_input_instance.text = "TestName"
+
+    monkeypatch.setattr(
+        new_char_view_module, "TextInput", Mock(return_value=mock_text_input_instance)
+    )
+    monkeypatch.setattr(new_char_view_module, "Button", Mock(return_value=mock_button))
+
+    view = NewCharView(on_create=mock_on_create)
+    return view, mock_on_create, mock_text_input_instance, mock_button
 
 
 def test_new_char_view_initialization(new_char_view):
@@ -71,7 +61,6 @@ def test_new_char_view_create_click_empty_name(new_char_view):
 
 def test_new_char_view_event_handling(new_char_view):
     view, _, mock_text_input, mock_button = new_char_view
-    event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"pos": (10, 10)})
-    view.handle_event(event)
+    view.handle_event(_CLICK_EVENT)
     mock_text_input.handle_event.assert_called_once()
     mock_button.handle_event.assert_called_once()
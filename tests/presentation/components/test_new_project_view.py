@@ -8,17 +8,10 @@ import pytest
 from decker_pygame.application.dtos import NewProjectViewDTO
 from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.components.new_project_view import NewProjectView
+from tests.presentation.components.conftest import click
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def new_project_data() -> NewProjectViewDTO:
     """Provides a sample NewProjectViewDTO for testing."""
     return NewProjectViewDTO(
@@ -33,7 +26,11 @@ def new_project_data() -> NewProjectViewDTO:
 def view(
     new_project_data: NewProjectViewDTO,
 ) -> tuple[NewProjectView, Mock, Mock]:
-    """Provides a NewProjectView instance with mock callbacks."""
+    """Provides a fresh NewProjectView and its mock callbacks.
+
+    Construction is cheap with the patched font, and a new view cannot leak tab,
+    selection or rating state from a previous test.
+    """
     on_start = Mock()
     on_close = Mock()
     view_instance = NewProjectView(
@@ -42,6 +39,13 @@ def view(
     return view_instance, on_start, on_close
 
 
+@pytest.fixture
+def buttons_by_text(view: tuple[NewProjectView, Mock, Mock]) -> dict[str, Button]:
+    """Indexes the view's buttons by label."""
+    view_instance, _, _ = view
+    return {c.text: c for c in view_instance._components if isinstance(c, Button)}
+
+
 def test_new_project_view_initialization(view: tuple[NewProjectView, Mock, Mock]):
     """Tests that the view initializes correctly and renders the default tab."""
     view_instance, _, _ = view
@@ -56,20 +60,7 @@ def test_tab_switching(view: tuple[NewProjectView, Mock, Mock]):
     view_instance, _, _ = view
 
     # Simulate click on chip tab button
-    chip_tab_button = view_instance._chip_tab_button
-    click_pos = chip_tab_button.rect.center
-    global_click_pos = (
-        click_pos[0] + view_instance.rect.x,
-        click_pos[1] + view_instance.rect.y,
-    )
-    down_event = pygame.event.Event(
-        pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": global_click_pos}
-    )
-    up_event = pygame.event.Event(
-        pygame.MOUSEBUTTONUP, {"button": 1, "pos": global_click_pos}
-    )
-    view_instance.handle_event(down_event)
-    view_instance.handle_event(up_event)
+    click(view_instance, view_instance._chip_tab_button.rect.center)
 
     # Check that tab and selected item are updated
     assert view_instance._active_tab == "chip"
@@ -102,7 +93,9 @@ def test_item_selection(view: tuple[NewProjectView, Mock, Mock]):
     assert view_instance._selected_item == "Sentry ICE"
 
 
-def test_start_button_click(view: tuple[NewProjectView, Mock, Mock]):
+def test_start_button_click(
+    view: tuple[NewProjectView, Mock, Mock], buttons_by_text: dict[str, Button]
+):
     """Tests that the start button calls the on_start callback with correct data."""
     view_instance, on_start, _ = view
 
@@ -110,25 +103,8 @@ def test_start_button_click(view: tuple[NewProjectView, Mock, Mock]):
     view_instance._selected_item = "Hammer"
     view_instance._rating_input.text = "3"
 
-    # Find the start button and simulate a click
-    start_button = [
-        c
-        for c in view_instance._components
-        if isinstance(c, Button) and c.text == "Start"
-    ][0]
-    click_pos = start_button.rect.center
-    global_click_pos = (
-        click_pos[0] + view_instance.rect.x,
-        click_pos[1] + view_instance.rect.y,
-    )
-    down_event = pygame.event.Event(
-        pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": global_click_pos}
-    )
-    up_event = pygame.event.Event(
-        pygame.MOUSEBUTTONUP, {"button": 1, "pos": global_click_pos}
-    )
-    view_instance.handle_event(down_event)
-    view_instance.handle_event(up_event)
+    # Invoke the start button's handler; event dispatch is covered by the tab test
+    buttons_by_text["Start"]._on_click()
 
     on_start.assert_called_once_with("software", "Hammer", 3)
 
@@ -147,44 +123,27 @@ def test_start_button_click_no_item_selected(view: tuple[NewProjectView, Mock, M
     on_start.assert_not_called()
 
 
-@pytest.mark.parametrize("invalid_rating", ["abc", "", "0", "-5"])
-def test_start_button_click_invalid_rating(
-    view: tuple[NewProjectView, Mock, Mock], invalid_rating: str
-):
+def test_start_button_click_invalid_rating(view: tuple[NewProjectView, Mock, Mock]):
     """Tests the start button does nothing if the rating is not a positive integer."""
     view_instance, on_start, _ = view
 
-    # Select an item but provide an invalid rating
+    # Select an item, then try each invalid rating in turn
     view_instance._selected_item = "Hammer"
-    view_instance._rating_input.text = invalid_rating
+    for invalid_rating in ("abc", "", "0", "-5"):
+        view_instance._rating_input.text = invalid_rating
 
-    # Call the handler directly to test its internal logic
-    view_instance._handle_start_click()
+        # Call the handler directly to test its internal logic
+        view_instance._handle_start_click()
 
     on_start.assert_not_called()
 
 
-def test_cancel_button_click(view: tuple[NewProjectView, Mock, Mock]):
+def test_cancel_button_click(
+    view: tuple[NewProjectView, Mock, Mock], buttons_by_text: dict[str, Button]
+):
     """Tests that the cancel button calls the on_close callback."""
     view_instance, _, on_close = view
 
-    cancel_button = [
-        c
-        for c in view_instance._components
-        if isinstance(c, Button) and c.text == "Cancel"
-    ][0]
-    click_pos = cancel_button.rect.center
-    global_click_pos = (
-        click_pos[0] + view_instance.rect.x,
-        click_pos[1] + view_instance.rect.y,
-    )
-    down_event = pygame.event.Event(
-        pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": global_click_pos}
-    )
-    up_event = pygame.event.Event(
-        pygame.MOUSEBUTTONUP, {"button": 1, "pos": global_click_pos}
-    )
-    view_instance.handle_event(down_event)
-    view_instance.handle_event(up_event)
+    buttons_by_text["Cancel"]._on_click()
 
     on_close.assert_called_once()
@@ -1,17 +1,11 @@
+from unittest.mock import patch
+
 import pygame
 import pytest
 
 from decker_pygame.presentation.components.node_view import NodeView
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
 @pytest.fixture
 def image_list() -> list[pygame.Surface]:
     """Provides a list of mock surfaces for testing."""
@@ -45,10 +39,12 @@ def test_set_state(image_list: list[pygame.Surface]):
     assert node_view._current_index == 1
 
 
-def test_set_state_invalid_index(image_list: list[pygame.Surface], capsys):
+def test_set_state_invalid_index(image_list: list[pygame.Surface]):
     """Tests that an invalid index does not change the state and prints a warning."""
     node_view = NodeView(position=(50, 60), images=image_list)
 
-    node_view.set_state(99)
+    with patch("builtins.print") as mock_print:
+        node_view.set_state(99)
+
     assert node_view.image is image_list[0]  # Should not change
-    assert "Warning: Invalid state_index 99" in capsys.readouterr().out
+    mock_print.assert_called_once_with("Warning: Invalid state_index 99 for NodeView.")
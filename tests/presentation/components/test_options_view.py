@@ -9,17 +9,10 @@ from decker_pygame.application.dtos import OptionsViewDTO
 from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.components.checkbox import Checkbox
 from decker_pygame.presentation.components.options_view import OptionsView
+from tests.presentation.components.conftest import StubSprite
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_callbacks() -> dict[str, Mock]:
     """Provides a dictionary of mock callback functions."""
     return {
@@ -32,7 +25,7 @@ def mock_callbacks() -> dict[str, Mock]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def options_view_data() -> OptionsViewDTO:
     """Provides sample data for the OptionsView."""
     return OptionsViewDTO(sound_enabled=True, tooltips_enabled=False)
@@ -42,7 +35,9 @@ def options_view_data() -> OptionsViewDTO:
 def options_view(
     options_view_data: OptionsViewDTO, mock_callbacks: dict[str, Mock]
 ) -> OptionsView:
-    """Provides an OptionsView instance for testing."""
+    """Provides a fresh OptionsView wired to the module's reset callback mocks."""
+    for callback in mock_callbacks.values():
+        callback.reset_mock()
     return OptionsView(
         data=options_view_data,
         on_save=mock_callbacks["on_save"],
@@ -54,70 +49,69 @@ def options_view(
     )
 
 
-def test_options_view_initialization(options_view: OptionsView):
+@pytest.fixture
+def buttons_by_name(options_view: OptionsView) -> dict[str, Button]:
+    """Indexes the view's buttons by their stable name."""
+    return {
+        c.name: c
+        for c in options_view._components
+        if isinstance(c, Button) and hasattr(c, "name")
+    }
+
+
+@pytest.fixture
+def checkboxes_by_name(options_view: OptionsView) -> dict[str, Checkbox]:
+    """Indexes the view's checkboxes by their stable name."""
+    return {
+        c.name: c
+        for c in options_view._components
+        if isinstance(c, Checkbox) and hasattr(c, "name")
+    }
+
+
+def test_options_view_initialization(
+    options_view: OptionsView, checkboxes_by_name: dict[str, Checkbox]
+):
     """Tests that the view is initialized correctly."""
     assert options_view.rect.topleft == (200, 200)
     # 1 title, 2 checkboxes, 4 buttons
     assert len(options_view._components) == 7
 
     # Find components by their stable 'name' attribute, not their display text/label.
-    # This assumes the Checkbox in OptionsView was given a name like 'sound_enabled'.
-    sound_checkbox = next(
-        c
-        for c in options_view._components
-        if isinstance(c, Checkbox) and hasattr(c, "name") and c.name == "sound_enabled"
-    )
-    # This assumes the Checkbox in OptionsView was given a name like 'tooltips_enabled'.
-    tooltips_checkbox = next(
-        c
-        for c in options_view._components
-        if isinstance(c, Checkbox)
-        and hasattr(c, "name")
-        and c.name == "tooltips_enabled"
-    )
+    sound_checkbox = checkboxes_by_name["sound_enabled"]
+    tooltips_checkbox = checkboxes_by_name["tooltips_enabled"]
 
     assert sound_checkbox.is_checked is True
     assert tooltips_checkbox.is_checked is False
 
 
-def test_button_callbacks(options_view: OptionsView, mock_callbacks: dict[str, Mock]):
+def test_button_callbacks(
+    buttons_by_name: dict[str, Button], mock_callbacks: dict[str, Mock]
+):
     """Tests that clicking the buttons triggers the correct callbacks."""
-    # Find buttons by their stable 'name' attribute, not their display text.
-    buttons = {
-        c.name: c
-        for c in options_view._components
-        if isinstance(c, Button) and hasattr(c, "name")
-    }
+    # Buttons are looked up by their stable 'name' attribute, not their display text.
 
     # Assuming the buttons in OptionsView were given names like 'save_game', etc.
-    buttons["save_game"]._on_click()
+    buttons_by_name["save_game"]._on_click()
     mock_callbacks["on_save"].assert_called_once()
 
-    buttons["load_game"]._on_click()
+    buttons_by_name["load_game"]._on_click()
     mock_callbacks["on_load"].assert_called_once()
 
-    buttons["quit_to_main_menu"]._on_click()
+    buttons_by_name["quit_to_main_menu"]._on_click()
     mock_callbacks["on_quit"].assert_called_once()
 
-    buttons["close"]._on_click()
+    buttons_by_name["close"]._on_click()
     mock_callbacks["on_close"].assert_called_once()
 
 
-def test_checkbox_callbacks(options_view: OptionsView, mock_callbacks: dict[str, Mock]):
+def test_checkbox_callbacks(
+    checkboxes_by_name: dict[str, Checkbox], mock_callbacks: dict[str, Mock]
+):
     """Tests that toggling the checkboxes triggers the correct callbacks."""
     # Find components by their stable 'name' attribute, not their display text/label.
-    sound_checkbox = next(
-        c
-        for c in options_view._components
-        if isinstance(c, Checkbox) and hasattr(c, "name") and c.name == "sound_enabled"
-    )
-    tooltips_checkbox = next(
-        c
-        for c in options_view._components
-        if isinstance(c, Checkbox)
-        and hasattr(c, "name")
-        and c.name == "tooltips_enabled"
-    )
+    sound_checkbox = checkboxes_by_name["sound_enabled"]
+    tooltips_checkbox = checkboxes_by_name["tooltips_enabled"]
 
     # Toggle sound (was True, becomes False)
     sound_checkbox._on_click()
@@ -128,14 +122,12 @@ def test_checkbox_callbacks(options_view: OptionsView, mock_callbacks: dict[str,
     mock_callbacks["on_toggle_tooltips"].assert_called_once_with(True)
 
 
-def test_options_view_handle_event_mouse(options_view: OptionsView):
+def test_options_view_handle_event_mouse(
+    options_view: OptionsView, buttons_by_name: dict[str, Button]
+):
     """Tests that mouse events are translated and passed to child components."""
     # Spy on a real component's handle_event method
-    mock_button = next(
-        c
-        for c in options_view._components
-        if isinstance(c, Button) and c.text == "Close"
-    )
+    mock_button = buttons_by_name["close"]
     with patch.object(mock_button, "handle_event") as mock_handler:
         # Create a mouse event with screen-space coordinates
         # view is at (200, 200)
@@ -156,15 +148,12 @@ def test_options_view_handle_event_mouse(options_view: OptionsView):
 
 def test_options_view_update(options_view: OptionsView):
     """Tests that the update method calls update on its children."""
-    # Add a mock component to spy on
-    mock_component = Mock(spec=pygame.sprite.Sprite)
-    # The mock needs 'image' and 'rect' attributes for the draw() call to work.
-    mock_component.image = pygame.Surface((1, 1))
-    mock_component.rect = pygame.Rect(0, 0, 1, 1)
-    options_view._components.add(mock_component)
+    # Add a stub component to spy on
+    stub = StubSprite()
+    options_view._components.add(stub)
 
     # Call the update method
     options_view.update()
 
-    # Assert that the mock component's update method was called
-    mock_component.update.assert_called_once()
+    # Assert that the stub component's update method was called
+    stub.update.assert_called_once()
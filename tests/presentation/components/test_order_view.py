@@ -1,22 +1,11 @@
 from unittest.mock import Mock, patch
 
-import pygame
-import pytest
-
 from decker_pygame.application.dtos import DeckViewDTO, ProgramDTO
-from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.components.order_view import OrderView
+from tests.presentation.components.conftest import click
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
-def test_order_view_initialization():
+def test_order_view_initialization(mock_button: Mock, mock_font: Mock):
     """Tests that the OrderView initializes and renders its data."""
     mock_on_close = Mock()
     mock_on_move_up = Mock()
@@ -30,21 +19,10 @@ def test_order_view_initialization():
         total_deck_size=100,
     )
 
-    with (
-        patch("pygame.font.Font") as mock_font_class,
-        patch(
-            "decker_pygame.presentation.components.order_view.Button"
-        ) as mock_button_class,
-    ):
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((100, 20))
-        mock_font_instance.get_linesize.return_value = 20
-        mock_font_class.return_value = mock_font_instance
-
-        mock_button_instance = Mock(spec=Button)
-        mock_button_instance.image = pygame.Surface((10, 10))
-        mock_button_instance.rect = pygame.Rect(0, 0, 10, 10)
-        mock_button_class.return_value = mock_button_instance
+    with patch(
+        "decker_pygame.presentation.components.order_view.Button"
+    ) as mock_button_class:
+        mock_button_class.return_value = mock_button
 
         view = OrderView(
             data=view_data,
@@ -55,8 +33,8 @@ def test_order_view_initialization():
 
         assert view is not None
         # 2 programs
-        assert mock_font_instance.render.call_count == 2
-        render_calls = mock_font_instance.render.call_args_list
+        assert mock_font.render.call_count == 2
+        render_calls = mock_font.render.call_args_list
         rendered_texts = [call.args[0] for call in render_calls]
         assert "1. IcePick" in rendered_texts
         assert "2. Hammer" in rendered_texts
@@ -65,7 +43,7 @@ def test_order_view_initialization():
         assert mock_button_class.call_count == 3
 
 
-def test_order_view_button_clicks():
+def test_order_view_button_clicks(mock_font: Mock):
     """Tests that clicking the up/down buttons triggers the correct callbacks."""
     mock_on_close = Mock()
     mock_on_move_up = Mock()
@@ -80,57 +58,27 @@ def test_order_view_button_clicks():
     )
 
     # We use real buttons for this test to verify the whole interaction
-    with patch("pygame.font.Font") as mock_font_class:
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((100, 20))
-        mock_font_instance.get_linesize.return_value = 20
-        mock_font_class.return_value = mock_font_instance
-
-        view = OrderView(
-            data=view_data,
-            on_close=mock_on_close,
-            on_move_up=mock_on_move_up,
-            on_move_down=mock_on_move_down,
-        )
-
-        # --- Test "Up" button for "Hammer" ---
-        up_button = view._up_buttons["Hammer"]
-        # The button's rect is relative to the view. The click event needs to be
-        # in screen space.
-        click_pos = (
-            up_button.rect.centerx + view.rect.x,
-            up_button.rect.centery + view.rect.y,
-        )
-        down_event = pygame.event.Event(
-            pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": click_pos}
-        )
-        up_event = pygame.event.Event(
-            pygame.MOUSEBUTTONUP, {"button": 1, "pos": click_pos}
-        )
-
-        view.handle_event(down_event)
-        view.handle_event(up_event)
+    view = OrderView(
+        data=view_data,
+        on_close=mock_on_close,
+        on_move_up=mock_on_move_up,
+        on_move_down=mock_on_move_down,
+    )
 
-        mock_on_move_up.assert_called_once_with("Hammer")
-        mock_on_move_down.assert_not_called()
+    # --- Test "Up" button for "Hammer" ---
+    up_button = view._up_buttons["Hammer"]
+    # The button's rect is relative to the view; click() converts it to screen
+    # space.
+    click(view, up_button.rect.center)
 
-        mock_on_move_up.reset_mock()
+    mock_on_move_up.assert_called_once_with("Hammer")
+    mock_on_move_down.assert_not_called()
 
-        # --- Test "Down" button for "IcePick" ---
-        down_button = view._down_buttons["IcePick"]
-        click_pos = (
-            down_button.rect.centerx + view.rect.x,
-            down_button.rect.centery + view.rect.y,
-        )
-        down_event = pygame.event.Event(
-            pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": click_pos}
-        )
-        up_event = pygame.event.Event(
-            pygame.MOUSEBUTTONUP, {"button": 1, "pos": click_pos}
-        )
+    mock_on_move_up.reset_mock()
 
-        view.handle_event(down_event)
-        view.handle_event(up_event)
+    # --- Test "Down" button for "IcePick" ---
+    down_button = view._down_buttons["IcePick"]
+    click(view, down_button.rect.center)
 
-        mock_on_move_down.assert_called_once_with("IcePick")
-        mock_on_move_up.assert_not_called()
+    mock_on_move_down.assert_called_once_with("IcePick")
+    mock_on_move_up.assert_not_called()
@@ -1,7 +1,5 @@
 """Tests for the PercentageBar component."""
 
-from collections.abc import Generator
-
 import pygame
 import pytest
 
@@ -9,14 +7,6 @@ from decker_pygame.presentation.components.percentage_bar import PercentageBar
 from decker_pygame.settings import RED, WHITE
 
 
-@pytest.fixture(autouse=True)
-def pygame_init_fixture() -> Generator[None]:
-    """Fixture to initialize pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
-
-
 def test_percentage_bar_initialization() -> None:
     """Tests that the PercentageBar initializes correctly."""
     bar = PercentageBar(position=(10, 20), width=100, height=10, initial_color=RED)
@@ -26,29 +16,29 @@ def test_percentage_bar_initialization() -> None:
     assert bar._color == RED
 
 
-def test_set_percentage() -> None:
-    """Tests that set_percentage correctly sets and clamps the value."""
-    bar = PercentageBar(position=(0, 0), width=100, height=10, initial_color=RED)
+@pytest.fixture(scope="module")
+def bar() -> PercentageBar:
+    """Provides one PercentageBar shared by the value-only tests."""
+    return PercentageBar(position=(0, 0), width=100, height=10, initial_color=RED)
 
-    # Test normal value
-    bar.set_percentage(50.5)
-    assert bar._percentage == 50.5
 
-    # Test clamping above 100
-    bar.set_percentage(120.0)
-    assert bar._percentage == 100.0
-
-    # Test clamping below 0
-    bar.set_percentage(-10.0)
-    assert bar._percentage == 0.0
+@pytest.mark.parametrize(
+    "value, expected",
+    [(50.5, 50.5), (120.0, 100.0), (-10.0, 0.0)],
+    ids=["normal", "clamp_high", "clamp_low"],
+)
+def test_set_percentage(bar: PercentageBar, value: float, expected: float) -> None:
+    """Tests that set_percentage correctly sets and clamps the value."""
+    bar.set_percentage(value)
+    assert bar._percentage == expected
 
 
 def test_update_draws_correctly() -> None:
     """Tests that the update method draws the bar with the correct width."""
-    bar = PercentageBar(position=(0, 0), width=200, height=10, initial_color=WHITE)
+    bar = PercentageBar(position=(0, 0), width=20, height=10, initial_color=WHITE)
 
     bar.set_percentage(50)
     bar.update()
-    # The bar should be filled up to half its width (100px).
-    assert bar.image.get_at((99, 5)) == WHITE  # Inside the filled area
-    assert bar.image.get_at((100, 5)) == pygame.Color(0, 0, 0, 0)
+    # The bar should be filled up to half its width (10px).
+    assert bar.image.get_at((9, 5)) == WHITE  # Inside the filled area
+    assert bar.image.get_at((10, 5)) == pygame.Color(0, 0, 0, 0)
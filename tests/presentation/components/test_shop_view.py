@@ -1,26 +1,30 @@
 from unittest.mock import Mock, patch
 
-import pygame
 import pytest
 
 from decker_pygame.application.dtos import ShopItemDTO, ShopViewDTO
 from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.components.shop_view import ShopView
+from tests.presentation.components.conftest import click
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
+def _buttons_by_text(view: ShopView) -> dict[str, Button]:
+    """Indexes a view's buttons by label in one pass over its components.
 
+    Every item row has its own Buy and View buttons, so the first row's buttons are
+    kept for repeated labels.
+    """
+    buttons: dict[str, Button] = {}
+    for sprite in view._components.sprites():
+        if isinstance(sprite, Button):
+            buttons.setdefault(sprite.text, sprite)
+    return buttons
 
-def test_shop_view_initialization():
-    """Tests that the ShopView initializes and renders its data."""
-    mock_on_close = Mock()
-    mock_on_purchase = Mock()
-    view_data = ShopViewDTO(
+
+@pytest.fixture(scope="module")
+def shop_dto() -> ShopViewDTO:
+    """Provides the shop data shared by every test in this module."""
+    return ShopViewDTO(
         shop_name="Test Shop",
         items=[
             ShopItemDTO(name="IcePick", cost=500, description="A basic tool."),
@@ -28,24 +32,21 @@ def test_shop_view_initialization():
         ],
     )
 
-    with (
-        patch("pygame.font.Font") as mock_font_class,
-        patch(
-            "decker_pygame.presentation.components.shop_view.Button"
-        ) as mock_button_class,
-    ):
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((100, 20))
-        mock_font_instance.get_linesize.return_value = 20
-        mock_font_class.return_value = mock_font_instance
-
-        mock_button_instance = Mock(spec=Button)
-        mock_button_instance.image = pygame.Surface((10, 10))
-        mock_button_instance.rect = pygame.Rect(0, 0, 10, 10)
-        mock_button_class.return_value = mock_button_instance
+
+def test_shop_view_initialization(
+    shop_dto: ShopViewDTO, mock_button: Mock, mock_font: Mock
+):
+    """Tests that the ShopView initializes and renders its data."""
+    mock_on_close = Mock()
+    mock_on_purchase = Mock()
+
+    with patch(
+        "decker_pygame.presentation.components.shop_view.Button"
+    ) as mock_button_class:
+        mock_button_class.return_value = mock_button
 
         view = ShopView(
-            data=view_data,
+            data=shop_dto,
             on_close=mock_on_close,
             on_purchase=mock_on_purchase,  # Added Mock for on_view_details
             on_view_details=Mock(),
@@ -53,8 +54,8 @@ def test_shop_view_initialization():
 
         assert view is not None
         # Title + 2 item names + 2 item descriptions
-        assert mock_font_instance.render.call_count == 5
-        render_calls = mock_font_instance.render.call_args_list
+        assert mock_font.render.call_count == 5
+        render_calls = mock_font.render.call_args_list
         rendered_texts = {call.args[0] for call in render_calls}
         assert "Test Shop" in rendered_texts
         assert "IcePick - $500" in rendered_texts
@@ -66,104 +67,48 @@ def test_shop_view_initialization():
         assert mock_button_class.call_count == 5
 
 
-def test_shop_view_delegates_purchase_event():
-    """Tests that clicking a buy button triggers the on_purchase callback."""
-    mock_on_close = Mock()
-    mock_on_purchase = Mock()
-    view_data = ShopViewDTO(
-        shop_name="Test Shop",
-        items=[ShopItemDTO(name="IcePick", cost=500, description="A basic tool.")],
-    )
-
-    with patch("pygame.font.Font") as mock_font_class:
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface(
-            (100, 20)
-        )  # Added parenthesis
-
-        # mock_font_instance.render.return_value = pygame.Surface((100, 20))
-
-        mock_font_instance.get_linesize.return_value = 20
-        mock_font_class.return_value = mock_font_instance
-
-        # Use real buttons to test the click interaction
-        view = ShopView(
-            data=view_data,
-            on_close=mock_on_close,
-            on_purchase=mock_on_purchase,
-            on_view_details=Mock(),
-        )
-
-        # Find the "Buy" button for "IcePick"
-        buy_button = next(
-            c
-            for c in view._components.sprites()
-            if isinstance(c, Button) and c.text == "Buy"
-        )
-
-        # The button's rect is relative to the view. The click event needs to be
-        # in screen space.
-        click_pos = (
-            buy_button.rect.centerx + view.rect.x,
-            buy_button.rect.centery + view.rect.y,
-        )
-        down_event = pygame.event.Event(
-            pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": click_pos}
-        )
-        up_event = pygame.event.Event(
-            pygame.MOUSEBUTTONUP, {"button": 1, "pos": click_pos}
-        )
-
-        view.handle_event(down_event)
-        view.handle_event(up_event)
-
-        mock_on_purchase.assert_called_once_with("IcePick")
-        mock_on_close.assert_not_called()
-
-
-def test_shop_view_delegates_view_details_event():
-    """Tests that clicking the "View" button triggers the on_view_details callback."""
-    mock_on_close = Mock()
-    mock_on_purchase = Mock()
-    mock_on_view_details = Mock()
-    view_data = ShopViewDTO(
-        shop_name="Test Shop",
-        items=[ShopItemDTO(name="IcePick", cost=500, description="A basic tool.")],
-    )
-
-    with patch("pygame.font.Font") as mock_font_class:
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((100, 20))
-        mock_font_instance.get_linesize.return_value = 20
-        mock_font_class.return_value = mock_font_instance
-
-        # Use real buttons to test the click interaction
-        view = ShopView(
-            data=view_data,
-            on_close=mock_on_close,
-            on_purchase=mock_on_purchase,
-            on_view_details=mock_on_view_details,
-        )
-
-        # Find the "View" button for "IcePick"
-        view_button = next(
-            c
-            for c in view._components.sprites()
-            if isinstance(c, Button) and c.text == "View"
-        )
-
-        # Simulate a click on the "View" button
-        click_pos = (
-            view_button.rect.centerx + view.rect.x,
-            view_button.rect.centery + view.rect.y,
-        )
-        down_event = pygame.event.Event(
-            pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": click_pos}
-        )
-        up_event = pygame.event.Event(
-            pygame.MOUSEBUTTONUP, {"button": 1, "pos": click_pos}
-        )
-        view.handle_event(down_event)
-        view.handle_event(up_event)
-
-        mock_on_view_details.assert_called_once_with("IcePick")
+@pytest.fixture
+def callbacks() -> dict[str, Mock]:
+    """Provides a fresh mock for each of the ShopView callbacks, keyed by name."""
+    return {
+        "on_close": Mock(),
+        "on_purchase": Mock(),
+        "on_view_details": Mock(),
+    }
+
+
+@pytest.mark.parametrize(
+    "button_text, callback_key",
+    [("Buy", "on_purchase"), ("View", "on_view_details")],
+    ids=["purchase", "view_details"],
+)
+def test_shop_view_delegates_item_button_click(
+    button_text: str,
+    callback_key: str,
+    shop_dto: ShopViewDTO,
+    mock_font: Mock,
+    callbacks: dict[str, Mock],
+):
+    """Tests that an item's button is wired to the matching callback."""
+    view = ShopView(data=shop_dto, **callbacks)
+
+    _buttons_by_text(view)[button_text]._on_click()
+
+    for key, callback in callbacks.items():
+        if key == callback_key:
+            callback.assert_called_once_with("IcePick")
+        else:
+            callback.assert_not_called()
+
+
+def test_shop_view_routes_clicks_to_item_buttons(
+    shop_dto: ShopViewDTO, mock_font: Mock, callbacks: dict[str, Mock]
+):
+    """Tests that a mouse click on a Buy button reaches it through the view."""
+    # Use real buttons to test the click interaction
+    view = ShopView(data=shop_dto, **callbacks)
+
+    click(view, _buttons_by_text(view)["Buy"].rect.center)
+
+    callbacks["on_purchase"].assert_called_once_with("IcePick")
+    callbacks["on_close"].assert_not_called()
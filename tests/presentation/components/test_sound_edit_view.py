@@ -9,19 +9,22 @@ from decker_pygame.application.dtos import SoundEditViewDTO
 from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.components.slider import Slider
 from decker_pygame.presentation.components.sound_edit_view import SoundEditView
+from tests.presentation.components.conftest import StubSprite
 
 
-@pytest.fixture(autouse=True)
-def pygame_context():
-    """Fixture to automatically initialize and quit Pygame for each test."""
-    pygame.init()
-    yield
-    pygame.quit()
+def _sliders(view: SoundEditView) -> list[Slider]:
+    """Lists a view's sliders in creation order (master, music, SFX)."""
+    return [c for c in view._components if isinstance(c, Slider)]
 
 
-@pytest.fixture
-def mock_callbacks() -> dict[str, Mock]:
-    """Provides a dictionary of mock callback functions."""
+def _buttons_by_text(view: SoundEditView) -> dict[str, Button]:
+    """Indexes a view's buttons by label."""
+    return {c.text: c for c in view._components if isinstance(c, Button)}
+
+
+@pytest.fixture(scope="module")
+def shared_callbacks() -> dict[str, Mock]:
+    """Provides the callback mocks once for the whole module."""
     return {
         "on_close": Mock(),
         "on_master_volume_change": Mock(),
@@ -31,42 +34,54 @@ def mock_callbacks() -> dict[str, Mock]:
 
 
 @pytest.fixture
+def mock_callbacks(shared_callbacks: dict[str, Mock]) -> dict[str, Mock]:
+    """Provides the shared callback mocks with their calls cleared."""
+    for callback in shared_callbacks.values():
+        callback.reset_mock()
+    return shared_callbacks
+
+
+@pytest.fixture(scope="module")
 def sound_view_data() -> SoundEditViewDTO:
     """Provides sample data for the SoundEditView."""
     return SoundEditViewDTO(master_volume=1.0, music_volume=0.5, sfx_volume=0.75)
 
 
+@pytest.fixture(scope="module")
+def shared_sound_edit_view(
+    sound_view_data: SoundEditViewDTO,
+    shared_callbacks: dict[str, Mock],
+    module_font: Mock,
+) -> SoundEditView:
+    """Provides one SoundEditView for the tests that do not change its state."""
+    return SoundEditView(data=sound_view_data, **shared_callbacks)
+
+
 @pytest.fixture
 def sound_edit_view(
     sound_view_data: SoundEditViewDTO, mock_callbacks: dict[str, Mock]
 ) -> SoundEditView:
-    """Provides a SoundEditView instance for testing."""
-    return SoundEditView(
-        data=sound_view_data,
-        on_close=mock_callbacks["on_close"],
-        on_master_volume_change=mock_callbacks["on_master_volume_change"],
-        on_music_volume_change=mock_callbacks["on_music_volume_change"],
-        on_sfx_volume_change=mock_callbacks["on_sfx_volume_change"],
-    )
+    """Provides a fresh SoundEditView for tests that send events or add children."""
+    return SoundEditView(data=sound_view_data, **mock_callbacks)
 
 
-def test_sound_edit_view_initialization(sound_edit_view: SoundEditView):
+def test_sound_edit_view_initialization(shared_sound_edit_view: SoundEditView):
     """Tests that the view is initialized correctly."""
-    assert sound_edit_view.rect.topleft == (250, 250)
+    assert shared_sound_edit_view.rect.topleft == (250, 250)
     # 3 labels, 3 sliders, 1 button
-    assert len(sound_edit_view._components) == 7
+    assert len(shared_sound_edit_view._components) == 7
 
-    sliders = [c for c in sound_edit_view._components if isinstance(c, Slider)]
+    sliders = _sliders(shared_sound_edit_view)
     assert sliders[0].value == 1.0  # Master
     assert sliders[1].value == 0.5  # Music
     assert sliders[2].value == 0.75  # SFX
 
 
 def test_close_button_callback(
-    sound_edit_view: SoundEditView, mock_callbacks: dict[str, Mock]
+    shared_sound_edit_view: SoundEditView, mock_callbacks: dict[str, Mock]
 ):
     """Tests that clicking the Close button triggers the on_close callback."""
-    close_button = next(c for c in sound_edit_view._components if isinstance(c, Button))
+    close_button = _buttons_by_text(shared_sound_edit_view)["Close"]
     close_button._on_click()
     mock_callbacks["on_close"].assert_called_once()
 
@@ -75,8 +90,7 @@ def test_slider_callbacks(
     sound_edit_view: SoundEditView, mock_callbacks: dict[str, Mock]
 ):
     """Tests that clicking a slider triggers the correct callback with a new value."""
-    sliders = [c for c in sound_edit_view._components if isinstance(c, Slider)]
-    music_slider = sliders[1]
+    music_slider = _sliders(sound_edit_view)[1]
 
     # To get a predictable value, we calculate the exact click position needed.
     # We want to click at a position that corresponds to 25% of the slider's value.
@@ -107,11 +121,8 @@ def test_slider_callbacks(
 
 def test_sound_edit_view_update(sound_edit_view: SoundEditView):
     """Tests that the update method calls update on its children."""
-    # Add a mock component to spy on
-    mock_component = Mock(spec=pygame.sprite.Sprite)
-    # The mock needs 'image' and 'rect' attributes for the draw() call to work.
-    mock_component.image = pygame.Surface((1, 1))
-    mock_component.rect = pygame.Rect(0, 0, 1, 1)
+    # Add a stub component to spy on
+    mock_component = StubSprite()
     sound_edit_view._components.add(mock_component)
 
     # Call the update method
@@ -1,25 +1,15 @@
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pygame
 import pytest
 
 from decker_pygame.presentation.components.text_input import TextInput
-
-
-@pytest.fixture(autouse=True)
-def pygame_context():
-    pygame.init()
-    yield
-    pygame.quit()
+from tests.presentation.components.conftest import evt
 
 
 @pytest.fixture
-def text_input():
-    with patch("pygame.font.Font") as mock_font_class:
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((50, 20))
-        mock_font_class.return_value = mock_font_instance
-        yield TextInput((100, 100), (200, 30), "Name:", "Decker")
+def text_input(mock_font: Mock):
+    return TextInput((100, 100), (200, 30), "Name:", "Decker")
 
 
 def test_text_input_initialization(text_input: TextInput):
@@ -31,7 +21,7 @@ def test_text_input_initialization(text_input: TextInput):
 
 def test_text_input_activation_on_click(text_input: TextInput):
     # Click inside
-    event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"pos": (150, 115)})
+    event = evt(pygame.MOUSEBUTTONDOWN, pos=(150, 115))
     text_input.handle_event(event)
     assert text_input._active
 
@@ -45,7 +35,7 @@ def test_text_input_deactivation_on_click_outside(text_input: TextInput):
     text_input._active = True
 
     # Click outside
-    event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"pos": (0, 0)})
+    event = evt(pygame.MOUSEBUTTONDOWN, pos=(0, 0))
     text_input.handle_event(event)
     assert not text_input._active
 
@@ -54,12 +44,12 @@ def test_text_input_handles_keydown_when_active(text_input: TextInput):
     text_input._active = True
 
     # Type a character
-    event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_a, "unicode": "a"})
+    event = evt(pygame.KEYDOWN, key=pygame.K_a, unicode="a")
     text_input.handle_event(event)
     assert text_input.text == "Deckera"
 
     # Use backspace
-    event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_BACKSPACE})
+    event = evt(pygame.KEYDOWN, key=pygame.K_BACKSPACE)
     text_input.handle_event(event)
     assert text_input.text == "Decker"
 
@@ -68,31 +58,26 @@ def test_text_input_ignores_keydown_when_inactive(text_input: TextInput):
     text_input._active = False
 
     # Type a character
-    event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_a, "unicode": "a"})
+    event = evt(pygame.KEYDOWN, key=pygame.K_a, unicode="a")
     text_input.handle_event(event)
     assert text_input.text == "Decker"
 
     # Use backspace
-    event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_BACKSPACE})
+    event = evt(pygame.KEYDOWN, key=pygame.K_BACKSPACE)
     text_input.handle_event(event)
     assert text_input.text == "Decker"
 
 
-def test_text_input_password_masking():
+def test_text_input_password_masking(mock_font: Mock):
     """Tests that the input is masked when is_password is True."""
-    with patch("pygame.font.Font") as mock_font_class:
-        mock_font_instance = Mock()
-        mock_font_instance.render.return_value = pygame.Surface((50, 20))
-        mock_font_class.return_value = mock_font_instance
-
-        password_input = TextInput(
-            (0, 0), (100, 30), "Password:", "secret", is_password=True
-        )
-
-        # The internal text should be correct
-        assert password_input.text == "secret"
-
-        # But the rendered text should be masked
-        # The last call to render in __init__ is the one we care about
-        call_args, _ = mock_font_instance.render.call_args_list[-1]
-        assert call_args[0] == "******"
+    password_input = TextInput(
+        (0, 0), (100, 30), "Password:", "secret", is_password=True
+    )
+
+    # The internal text should be correct
+    assert password_input.text == "secret"
+
+    # But the rendered text should be masked
+    # The last call to render in __init__ is the one we care about
+    call_args, _ = mock_font.render.call_args_list[-1]
+    assert call_args[0] == "******"
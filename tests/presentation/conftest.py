@@ -1,9 +1,10 @@
 """This file contains shared fixtures for the presentation layer tests."""
 
+import functools
 import uuid
 from collections.abc import Generator
 from dataclasses import dataclass
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, create_autospec, patch
 
 import pygame
 import pytest
@@ -25,8 +26,40 @@ from decker_pygame.ports.service_interfaces import (
     ShopServiceInterface,
 )
 from decker_pygame.presentation.asset_service import AssetService
+from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.game import Game
 from decker_pygame.presentation.input_handler import PygameInputHandler
+from tests.presentation.surfaces import DUMMY_SURFACE
+
+
+@functools.lru_cache(maxsize=1)
+def _button_spec() -> Mock:
+    """Builds the shared autospec'd Button on first use.
+
+    Spec introspection of Button then happens once per session instead of once
+    per test; the ``mock_button`` fixture only resets it.
+    """
+    button = create_autospec(Button, instance=True)
+    button.image = DUMMY_SURFACE
+    return button
+
+
+@pytest.fixture
+def mock_button() -> Mock:
+    """Provides a reset, autospec'd Button instance that can be drawn by a Group."""
+    button = _button_spec()
+    button.reset_mock(return_value=True, side_effect=True)
+    button.rect = pygame.Rect(0, 0, 10, 10)
+    return button
+
+
+@pytest.fixture(scope="module")
+def module_button() -> Mock:
+    """Provides the shared autospec'd Button, reset once for a module-scoped view."""
+    button = _button_spec()
+    button.reset_mock(return_value=True, side_effect=True)
+    button.rect = pygame.Rect(0, 0, 10, 10)
+    return button
 
 
 @dataclass
@@ -68,8 +101,8 @@ def game_with_mocks() -> Generator[Mocks]:
     mock_matrix_run_service = Mock(spec=MatrixRunServiceInterface)
     mock_logging_service = Mock(spec=LoggingServiceInterface)
     mock_event_dispatcher = Mock(spec=EventDispatcher)
-    dummy_player_id = PlayerId(uuid.uuid4())
-    dummy_character_id = CharacterId(uuid.uuid4())
+    dummy_player_id = PlayerId(uuid.UUID(int=1))
+    dummy_character_id = CharacterId(uuid.UUID(int=2))
 
     # Configure the asset service mock to return a valid icon
     mock_asset_service.get_spritesheet.return_value = [pygame.Surface((16, 16))]
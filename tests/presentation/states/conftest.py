@@ -0,0 +1,75 @@
+"""Shared fixtures for the game state tests."""
+
+from collections.abc import Generator
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from decker_pygame.presentation.components.build_view import BuildView
+from decker_pygame.presentation.components.char_data_view import CharDataView
+from decker_pygame.presentation.components.contract_data_view import ContractDataView
+from decker_pygame.presentation.components.contract_list_view import ContractListView
+from decker_pygame.presentation.components.deck_view import DeckView
+from decker_pygame.presentation.components.home_view import HomeView
+from decker_pygame.presentation.components.ice_data_view import IceDataView
+from decker_pygame.presentation.components.intro_view import IntroView
+from decker_pygame.presentation.components.matrix_run_view import MatrixRunView
+from decker_pygame.presentation.components.new_char_view import NewCharView
+from decker_pygame.presentation.components.order_view import OrderView
+from decker_pygame.presentation.components.shop_item_view import ShopItemView
+from decker_pygame.presentation.components.shop_view import ShopView
+from decker_pygame.presentation.components.transfer_view import TransferView
+from decker_pygame.presentation.states import states as states_module
+
+# The view classes the states construct; tests swap them for spec'd mocks.
+_STATE_VIEW_CLASSES = (
+    BuildView,
+    CharDataView,
+    ContractDataView,
+    ContractListView,
+    DeckView,
+    HomeView,
+    IceDataView,
+    IntroView,
+    MatrixRunView,
+    NewCharView,
+    OrderView,
+    ShopItemView,
+    ShopView,
+    TransferView,
+)
+
+
+@pytest.fixture(scope="module")
+def shared_view_mocks() -> Generator[SimpleNamespace]:
+    """Replaces the state module's view classes with mocks for the whole module.
+
+    The mocks are exposed by class name, e.g. ``view_mocks.HomeView``.
+    """
+    mocks = {cls.__name__: Mock(spec=cls) for cls in _STATE_VIEW_CLASSES}
+    with pytest.MonkeyPatch.context() as mp:
+        for name, mock in mocks.items():
+            mp.setattr(states_module, name, mock)
+        yield SimpleNamespace(**mocks)
+
+
+@pytest.fixture
+def view_mocks(shared_view_mocks: SimpleNamespace) -> SimpleNamespace:
+    """Provides the patched view class mocks with their calls cleared."""
+    for mock in vars(shared_view_mocks).values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    return shared_view_mocks
+
+
+@pytest.fixture(scope="module")
+def shared_game() -> Mock:
+    """Provides one mock Game for the whole module."""
+    return Mock()
+
+
+@pytest.fixture
+def mock_game(shared_game: Mock) -> Mock:
+    """Provides the shared mock Game with its calls and configured values cleared."""
+    shared_game.reset_mock(return_value=True, side_effect=True)
+    return shared_game
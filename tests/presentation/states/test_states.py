@@ -1,35 +1,21 @@
 """Tests for the concrete game state classes and their base protocol."""
 
-from typing import TYPE_CHECKING
-from unittest.mock import Mock, patch
+from collections.abc import Callable
+from operator import attrgetter
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, NamedTuple, cast
+from unittest.mock import DEFAULT, Mock, patch
 
 import pygame
 import pytest
 
 from decker_pygame.application.crafting_service import CraftingError
 from decker_pygame.application.dtos import (
-    CharacterViewDTO,
     ContractSummaryDTO,
     DeckViewDTO,
     IceDataViewDTO,
     ShopItemViewDTO,
-    ShopViewDTO,
-    TransferViewDTO,
 )
-from decker_pygame.presentation.components.build_view import BuildView
-from decker_pygame.presentation.components.char_data_view import CharDataView
-from decker_pygame.presentation.components.contract_data_view import ContractDataView
-from decker_pygame.presentation.components.contract_list_view import ContractListView
-from decker_pygame.presentation.components.deck_view import DeckView
-from decker_pygame.presentation.components.home_view import HomeView
-from decker_pygame.presentation.components.ice_data_view import IceDataView
-from decker_pygame.presentation.components.intro_view import IntroView
-from decker_pygame.presentation.components.matrix_run_view import MatrixRunView
-from decker_pygame.presentation.components.new_char_view import NewCharView
-from decker_pygame.presentation.components.order_view import OrderView
-from decker_pygame.presentation.components.shop_item_view import ShopItemView
-from decker_pygame.presentation.components.shop_view import ShopView
-from decker_pygame.presentation.components.transfer_view import TransferView
 from decker_pygame.presentation.states.game_states import BaseState
 from decker_pygame.presentation.states.states import (
     HomeState,
@@ -37,10 +23,14 @@ from decker_pygame.presentation.states.states import (
     MatrixRunState,
     NewCharState,
 )
+from tests.presentation.surfaces import DUMMY_SURFACE
 
 if TYPE_CHECKING:
     from decker_pygame.presentation.game import Game
 
+# Shared pass-through event; the states only forward it, never mutate it.
+_DUMMY_EVENT = pygame.event.Event(pygame.USEREVENT)
+
 
 class DummyState(BaseState):
     """A concrete class for testing the BaseState protocol for coverage."""
@@ -64,227 +54,304 @@ class DummyState(BaseState):
         """Dummy draw."""
 
 
-def test_base_state_protocol_coverage() -> None:
+def test_base_state_protocol_coverage(mock_game: Mock) -> None:
     """This test exists purely to satisfy coverage for the protocol definition."""
-    mock_game = Mock()
     state = DummyState(mock_game)
     state.on_enter()
     state.on_exit()
-    state.handle_event(pygame.event.Event(pygame.USEREVENT))
+    state.handle_event(_DUMMY_EVENT)
     state.update(0.1)
-    state.draw(Mock(spec=pygame.Surface))
-
-
-def test_intro_state_lifecycle() -> None:
-    """Tests that IntroState correctly toggles the IntroView via the ViewManager."""
-    mock_game = Mock()
-    mock_game.view_manager = Mock()
-    state = IntroState(mock_game)
-
-    # --- Test on_enter ---
-    state.on_enter()
-    mock_game.view_manager.toggle_view.assert_called_once()
-
-    # Check the arguments passed to toggle_view
-    view_attr_arg = mock_game.view_manager.toggle_view.call_args.args[0]
-    factory_arg = mock_game.view_manager.toggle_view.call_args.args[1]
-    assert view_attr_arg == "intro_view"
-
-    # Test the factory function itself
-    with patch(
-        "decker_pygame.presentation.states.states.IntroView", spec=IntroView
-    ) as mock_intro_view_class:
-        created_view = factory_arg()
-        mock_intro_view_class.assert_called_once_with(
-            on_continue=mock_game._continue_from_intro
-        )
-        assert created_view is mock_intro_view_class.return_value
-
-    # --- Test on_exit ---
-    mock_game.view_manager.reset_mock()
-    state.on_exit()
-    mock_game.view_manager.toggle_view.assert_called_once_with(
-        "intro_view", state._factory
+    state.draw(DUMMY_SURFACE)
+
+
+@pytest.fixture
+def stub_game() -> SimpleNamespace:
+    """Provides a plain Game stand-in for the lifecycle tests.
+
+    Only the collaborators whose calls are asserted are mocks; the callbacks
+    the view factories pass through are identity sentinels.
+    """
+    return SimpleNamespace(
+        view_manager=Mock(),
+        update_sprites=Mock(),
+        all_sprites=Mock(),
+        _continue_from_intro=object(),
+        _handle_character_creation=object(),
+        toggle_project_data_view=object(),
+        asset_service=object(),
     )
 
-    # --- Test update, draw, and event handling delegation ---
-    state.handle_event(pygame.event.Event(pygame.USEREVENT))
-    state.update(0.016)
-    mock_game.update_sprites.assert_called_once_with(0.016)
-    mock_screen = Mock(spec=pygame.Surface)
-    state.draw(mock_screen)
-    mock_game.all_sprites.draw.assert_called_once_with(mock_screen)
-
 
-def test_new_char_state_lifecycle() -> None:
-    """Tests that NewCharState correctly toggles the NewCharView."""
-    mock_game = Mock()
-    mock_game.view_manager = Mock()
-    state = NewCharState(mock_game)
+def _home_view_kwargs(game: SimpleNamespace, state: HomeState) -> dict[str, object]:
+    """The callbacks HomeState wires into its HomeView."""
+    return {
+        "on_char": state._toggle_char_data_view,
+        "on_deck": state._toggle_deck_view,
+        "on_contracts": state._toggle_contract_list_view,
+        "on_build": state._toggle_build_view,
+        "on_shop": state._toggle_shop_view,
+        "on_transfer": state._toggle_transfer_view,
+        "on_projects": game.toggle_project_data_view,
+    }
+
+
+@pytest.mark.parametrize(
+    ("state_class", "view_attr", "view_name", "view_kwargs"),
+    [
+        (
+            IntroState,
+            "intro_view",
+            "IntroView",
+            lambda game, state: {"on_continue": game._continue_from_intro},
+        ),
+        (
+            NewCharState,
+            "new_char_view",
+            "NewCharView",
+            lambda game, state: {"on_create": game._handle_character_creation},
+        ),
+        (HomeState, "home_view", "HomeView", _home_view_kwargs),
+        (
+            MatrixRunState,
+            "matrix_run_view",
+            "MatrixRunView",
+            lambda game, state: {"asset_service": game.asset_service},
+        ),
+    ],
+    ids=["intro", "new_char", "home", "matrix_run"],
+)
+def test_state_lifecycle(
+    stub_game: SimpleNamespace,
+    view_mocks: SimpleNamespace,
+    state_class: type[IntroState | NewCharState | HomeState | MatrixRunState],
+    view_attr: str,
+    view_name: str,
+    view_kwargs: Callable[..., dict[str, object]],
+) -> None:
+    """Tests that each state toggles its view and delegates the frame loop."""
+    state = state_class(cast("Game", stub_game))
 
     # --- Test on_enter ---
     state.on_enter()
-    mock_game.view_manager.toggle_view.assert_called_once()
+    stub_game.view_manager.toggle_view.assert_called_once()
 
     # Check the arguments passed to toggle_view
-    view_attr_arg = mock_game.view_manager.toggle_view.call_args.args[0]
-    factory_arg = mock_game.view_manager.toggle_view.call_args.args[1]
-    assert view_attr_arg == "new_char_view"
+    view_attr_arg = stub_game.view_manager.toggle_view.call_args.args[0]
+    factory_arg = stub_game.view_manager.toggle_view.call_args.args[1]
+    assert view_attr_arg == view_attr
 
     # Test the factory function itself
-    with patch(
-        "decker_pygame.presentation.states.states.NewCharView", spec=NewCharView
-    ) as mock_view_class:
-        created_view = factory_arg()
-        mock_view_class.assert_called_once_with(
-            on_create=mock_game._handle_character_creation
-        )
-        assert created_view is mock_view_class.return_value
+    mock_view_class = getattr(view_mocks, view_name)
+    created_view = factory_arg()
+    mock_view_class.assert_called_once_with(**view_kwargs(stub_game, state))
+    assert created_view is mock_view_class.return_value
 
     # --- Test on_exit ---
-    mock_game.view_manager.reset_mock()
+    stub_game.view_manager.reset_mock()
     state.on_exit()
-    mock_game.view_manager.toggle_view.assert_called_once_with(
-        "new_char_view", state._factory
+    stub_game.view_manager.toggle_view.assert_called_once_with(
+        view_attr, state._factory
     )
 
     # --- Test update, draw, and event handling delegation ---
-    state.handle_event(pygame.event.Event(pygame.USEREVENT))
+    state.handle_event(_DUMMY_EVENT)
     state.update(0.016)
-    mock_game.update_sprites.assert_called_once_with(0.016)
-    mock_screen = Mock(spec=pygame.Surface)
-    state.draw(mock_screen)
-    mock_game.all_sprites.draw.assert_called_once_with(mock_screen)
-
-
-def test_home_state_lifecycle() -> None:
-    """Tests that HomeState correctly toggles the HomeView."""
-    mock_game = Mock()
-    mock_game.view_manager = Mock()
+    stub_game.update_sprites.assert_called_once_with(0.016)
+    state.draw(DUMMY_SURFACE)
+    stub_game.all_sprites.draw.assert_called_once_with(DUMMY_SURFACE)
+
+
+class _ToggleCase(NamedTuple):
+    """A HomeState toggle that builds a view from a single service lookup."""
+
+    toggle: str
+    service: str
+    view: str
+    layout: dict[str, object]
+    data_kwarg: str
+    callbacks: dict[str, str]
+    no_data: object
+    no_data_message: str
+
+
+_TOGGLE_CASES = [
+    _ToggleCase(
+        toggle="_toggle_char_data_view",
+        service="character_service.get_character_view_data",
+        view="CharDataView",
+        layout={"position": (150, 100)},
+        data_kwarg="data",
+        callbacks={
+            "on_close": "_toggle_char_data_view",
+            "on_increase_skill": "_on_increase_skill",
+            "on_decrease_skill": "_on_decrease_skill",
+        },
+        no_data=None,
+        no_data_message="Error: Could not retrieve character/player data.",
+    ),
+    _ToggleCase(
+        toggle="_toggle_build_view",
+        service="crafting_service.get_character_schematics",
+        view="BuildView",
+        layout={"position": (200, 150), "size": (400, 300)},
+        data_kwarg="schematics",
+        callbacks={"on_build_click": "_handle_build_click"},
+        no_data=[],
+        no_data_message="No schematics known.",
+    ),
+    _ToggleCase(
+        toggle="_toggle_shop_view",
+        service="shop_service.get_shop_view_data",
+        view="ShopView",
+        layout={},
+        data_kwarg="data",
+        callbacks={
+            "on_close": "_toggle_shop_view",
+            "on_purchase": "_on_purchase",
+            "on_view_details": "_on_show_item_details",
+        },
+        no_data=None,
+        no_data_message="Error: Could not load shop data.",
+    ),
+    _ToggleCase(
+        toggle="_toggle_transfer_view",
+        service="deck_service.get_transfer_view_data",
+        view="TransferView",
+        layout={},
+        data_kwarg="data",
+        callbacks={
+            "on_close": "_toggle_transfer_view",
+            "on_move_to_deck": "_on_move_program_to_deck",
+            "on_move_to_storage": "_on_move_program_to_storage",
+        },
+        no_data=None,
+        no_data_message="Error: Could not retrieve transfer data.",
+    ),
+]
+_TOGGLE_IDS = ["char_data", "build", "shop", "transfer"]
+
+
+@pytest.mark.parametrize("case", _TOGGLE_CASES, ids=_TOGGLE_IDS)
+def test_home_state_toggle_builds_view(
+    case: _ToggleCase, mock_game: Mock, view_mocks: SimpleNamespace
+) -> None:
+    """Tests that a HomeState toggle's factory builds its view from service data."""
     state = HomeState(mock_game)
+    view_data = Mock()
+    attrgetter(case.service)(mock_game).return_value = view_data
 
-    # --- Test on_enter ---
-    state.on_enter()
-    mock_game.view_manager.toggle_view.assert_called_once()
-
-    # Check the arguments passed to toggle_view
-    view_attr_arg = mock_game.view_manager.toggle_view.call_args.args[0]
-    factory_arg = mock_game.view_manager.toggle_view.call_args.args[1]
-    assert view_attr_arg == "home_view"
-
-    # Test the factory function itself
-    with patch(
-        "decker_pygame.presentation.states.states.HomeView", spec=HomeView
-    ) as mock_view_class:
-        created_view = factory_arg()
-        mock_view_class.assert_called_once_with(
-            on_char=state._toggle_char_data_view,
-            on_deck=state._toggle_deck_view,
-            on_contracts=state._toggle_contract_list_view,
-            on_build=state._toggle_build_view,
-            on_shop=state._toggle_shop_view,
-            on_transfer=state._toggle_transfer_view,
-            on_projects=mock_game.toggle_project_data_view,
-        )
-        assert created_view is mock_view_class.return_value
+    getattr(state, case.toggle)()
+    factory = mock_game.view_manager.toggle_view.call_args.args[1]
+    created_view = factory()
 
-    # --- Test on_exit ---
-    mock_game.view_manager.reset_mock()
-    state.on_exit()
-    mock_game.view_manager.toggle_view.assert_called_once_with(
-        "home_view", state._factory
+    view_class = getattr(view_mocks, case.view)
+    view_class.assert_called_once_with(
+        **case.layout,
+        **{case.data_kwarg: view_data},
+        **{kwarg: getattr(state, attr) for kwarg, attr in case.callbacks.items()},
     )
-
-    # --- Test update, draw, and event handling delegation ---
-    state.handle_event(pygame.event.Event(pygame.USEREVENT))
-    state.update(0.016)
-    mock_game.update_sprites.assert_called_once_with(0.016)
-    mock_screen = Mock(spec=pygame.Surface)
-    state.draw(mock_screen)
-    mock_game.all_sprites.draw.assert_called_once_with(mock_screen)
+    assert created_view is view_class.return_value
 
 
-def test_home_state_char_data_view_logic() -> None:
-    """Tests the HomeState's logic for managing the CharDataView."""
-    mock_game = Mock()
-    mock_game.view_manager = Mock()
+@pytest.mark.parametrize("case", _TOGGLE_CASES, ids=_TOGGLE_IDS)
+def test_home_state_toggle_handles_no_data(
+    case: _ToggleCase, mock_game: Mock, view_mocks: SimpleNamespace
+) -> None:
+    """Tests that a HomeState toggle's factory reports missing service data."""
     state = HomeState(mock_game)
+    attrgetter(case.service)(mock_game).return_value = case.no_data
 
-    # --- Test toggling the view ---
-    # Mock the service call
-    mock_view_data = Mock(spec=CharacterViewDTO)
-    mock_game.character_service.get_character_view_data.return_value = mock_view_data
-
-    with patch(
-        "decker_pygame.presentation.states.states.CharDataView", spec=CharDataView
-    ) as mock_char_view_class:
-        state._toggle_char_data_view()
-        mock_game.view_manager.toggle_view.assert_called_once()
-
-        # Check factory
-        factory = mock_game.view_manager.toggle_view.call_args.args[1]
-        created_view = factory()
-
-        mock_char_view_class.assert_called_once_with(
-            position=(150, 100),
-            data=mock_view_data,
-            on_close=state._toggle_char_data_view,
-            on_increase_skill=state._on_increase_skill,
-            on_decrease_skill=state._on_decrease_skill,
-        )
-        assert created_view is mock_char_view_class.return_value
-
-    # --- Test toggling with no data ---
-    mock_game.reset_mock()
-    mock_game.character_service.get_character_view_data.return_value = None
-    state._toggle_char_data_view()
-    # The factory will return None, so toggle_view is still called, but with a factory
-    # that returns None.
+    getattr(state, case.toggle)()
     factory = mock_game.view_manager.toggle_view.call_args.args[1]
-    assert factory() is None
-    mock_game.show_message.assert_called_once_with(
-        "Error: Could not retrieve character/player data."
-    )
-
-    # --- Test skill increase callback ---
-    mock_game.reset_mock()
 
-    # Mock the executor to actually call the action it receives.
-    def mock_executor(action, toggler):
-        action()
-        toggler()
-        toggler()
+    assert factory() is None
+    mock_game.show_message.assert_called_once_with(case.no_data_message)
+    getattr(view_mocks, case.view).assert_not_called()
+
+
+def _run_and_refresh(action: Callable[[], None], refresh: Callable[[], None]) -> None:
+    """Stands in for Game._execute_and_refresh_view: run, then close and reopen."""
+    action()
+    refresh()
+    refresh()
+
+
+@pytest.mark.parametrize(
+    "callback, arg, service, extra_args, refresh",
+    [
+        (
+            "_on_increase_skill",
+            "hacking",
+            "character_service.increase_skill",
+            (),
+            "_toggle_char_data_view",
+        ),
+        (
+            "_on_decrease_skill",
+            "crafting",
+            "character_service.decrease_skill",
+            (),
+            "_toggle_char_data_view",
+        ),
+        (
+            "_on_purchase",
+            "TestItem",
+            "shop_service.purchase_item",
+            ("DefaultShop",),
+            "_toggle_shop_view",
+        ),
+        (
+            "_on_move_program_to_deck",
+            "TestProgram",
+            "deck_service.move_program_to_deck",
+            (),
+            "_toggle_transfer_view",
+        ),
+        (
+            "_on_move_program_to_storage",
+            "TestProgram2",
+            "deck_service.move_program_to_storage",
+            (),
+            "_toggle_transfer_view",
+        ),
+    ],
+    ids=[
+        "increase_skill",
+        "decrease_skill",
+        "purchase",
+        "move_to_deck",
+        "move_to_storage",
+    ],
+)
+def test_home_state_action_calls_service_and_refreshes(
+    mock_game: Mock,
+    callback: str,
+    arg: str,
+    service: str,
+    extra_args: tuple[str, ...],
+    refresh: str,
+) -> None:
+    """Tests that a HomeState action calls its service and refreshes its view."""
+    state = HomeState(mock_game)
+    mock_game._execute_and_refresh_view.side_effect = _run_and_refresh
 
-    mock_game._execute_and_refresh_view.side_effect = mock_executor
-    state._on_increase_skill("hacking")
-    mock_game.character_service.increase_skill.assert_called_once_with(
-        mock_game.character_id, "hacking"
-    )
-    mock_game._execute_and_refresh_view.assert_called_once()
-    # Check that the correct view toggler was passed
-    assert (
-        mock_game._execute_and_refresh_view.call_args.args[1]
-        == state._toggle_char_data_view
-    )
+    getattr(state, callback)(arg)
 
-    # --- Test skill decrease callback ---
-    mock_game.reset_mock()
-    mock_game._execute_and_refresh_view.side_effect = mock_executor
-    state._on_decrease_skill("crafting")
-    mock_game.character_service.decrease_skill.assert_called_once_with(
-        mock_game.character_id, "crafting"
+    attrgetter(service)(mock_game).assert_called_once_with(
+        mock_game.character_id, arg, *extra_args
     )
     mock_game._execute_and_refresh_view.assert_called_once()
-    assert (
-        mock_game._execute_and_refresh_view.call_args.args[1]
-        == state._toggle_char_data_view
+    assert mock_game._execute_and_refresh_view.call_args.args[1] == getattr(
+        state, refresh
     )
+    # The refresh closes and reopens the view.
+    assert mock_game.view_manager.toggle_view.call_count == 2
 
 
-def test_home_state_deck_and_order_view_logic() -> None:
+def test_home_state_deck_and_order_view_logic(
+    mock_game: Mock, view_mocks: SimpleNamespace
+) -> None:
     """Tests the HomeState's logic for managing the DeckView and OrderView."""
-    mock_game = Mock()
-    mock_game.view_manager = Mock()
     state = HomeState(mock_game)
 
     # Mock service calls
@@ -294,50 +361,47 @@ def test_home_state_deck_and_order_view_logic() -> None:
     mock_game.deck_service.get_deck_view_data.return_value = mock_deck_data
 
     # --- Test _toggle_deck_view ---
-    with patch(
-        "decker_pygame.presentation.states.states.DeckView", spec=DeckView
-    ) as mock_deck_view_class:
-        state._toggle_deck_view()
-        factory = mock_game.view_manager.toggle_view.call_args.args[1]
-        created_view = factory()
-        mock_deck_view_class.assert_called_once_with(
-            data=mock_deck_data,
-            on_close=state._toggle_deck_view,
-            on_order=state._handle_order_click,
-            on_program_click=state._on_program_click,
-        )
-        assert created_view is mock_deck_view_class.return_value
+    mock_deck_view_class = view_mocks.DeckView
+    state._toggle_deck_view()
+    factory = mock_game.view_manager.toggle_view.call_args.args[1]
+    created_view = factory()
+    mock_deck_view_class.assert_called_once_with(
+        data=mock_deck_data,
+        on_close=state._toggle_deck_view,
+        on_order=state._handle_order_click,
+        on_program_click=state._on_program_click,
+    )
+    assert created_view is mock_deck_view_class.return_value
 
     # --- Test _toggle_order_view ---
     mock_game.view_manager.reset_mock()
-    with patch(
-        "decker_pygame.presentation.states.states.OrderView", spec=OrderView
-    ) as mock_order_view_class:
-        state._toggle_order_view()
-        factory = mock_game.view_manager.toggle_view.call_args.args[1]
-        created_view = factory()
-        mock_order_view_class.assert_called_once_with(
-            data=mock_deck_data,
-            on_close=state._handle_order_close,
-            on_move_up=state._on_move_program_up,
-            on_move_down=state._on_move_program_down,
-        )
-        assert created_view is mock_order_view_class.return_value
+    mock_order_view_class = view_mocks.OrderView
+    state._toggle_order_view()
+    factory = mock_game.view_manager.toggle_view.call_args.args[1]
+    created_view = factory()
+    mock_order_view_class.assert_called_once_with(
+        data=mock_deck_data,
+        on_close=state._handle_order_close,
+        on_move_up=state._on_move_program_up,
+        on_move_down=state._on_move_program_down,
+    )
+    assert created_view is mock_order_view_class.return_value
 
     # --- Test transitions ---
     mock_game.view_manager.reset_mock()
-    with patch.object(state, "_toggle_deck_view") as mock_toggle_deck:
-        with patch.object(state, "_toggle_order_view") as mock_toggle_order:
-            state._handle_order_click()
-            mock_toggle_deck.assert_called_once()
-            mock_toggle_order.assert_called_once()
+    with patch.multiple(
+        state, _toggle_deck_view=DEFAULT, _toggle_order_view=DEFAULT
+    ) as toggles:
+        state._handle_order_click()
+        toggles["_toggle_deck_view"].assert_called_once()
+        toggles["_toggle_order_view"].assert_called_once()
 
-            mock_toggle_deck.reset_mock()
-            mock_toggle_order.reset_mock()
+        toggles["_toggle_deck_view"].reset_mock()
+        toggles["_toggle_order_view"].reset_mock()
 
-            state._handle_order_close()
-            mock_toggle_deck.assert_called_once()
-            mock_toggle_order.assert_called_once()
+        state._handle_order_close()
+        toggles["_toggle_deck_view"].assert_called_once()
+        toggles["_toggle_order_view"].assert_called_once()
 
     # --- Test program move callbacks ---
     def mock_executor(action, toggler):
@@ -382,10 +446,8 @@ def test_home_state_deck_and_order_view_logic() -> None:
         mock_toggle_ice.assert_not_called()
 
 
-def test_home_state_deck_and_order_view_failures() -> None:
+def test_home_state_deck_and_order_view_failures(mock_game: Mock) -> None:
     """Tests the failure paths for the DeckView and OrderView logic."""
-    mock_game = Mock()
-    mock_game.view_manager = Mock()
     state = HomeState(mock_game)
 
     # --- Test failure when character data is missing ---
@@ -414,9 +476,8 @@ def test_home_state_deck_and_order_view_failures() -> None:
     mock_game.show_message.assert_called_with("Error: Could not retrieve deck data.")
 
 
-def test_home_state_perform_move_up_action_failure() -> None:
+def test_home_state_perform_move_up_action_failure(mock_game: Mock) -> None:
     """Tests the failure path for the move up action when character is not found."""
-    mock_game = Mock()
     state = HomeState(mock_game)
     mock_game.character_service.get_character_data.return_value = None
 
@@ -431,10 +492,8 @@ def test_home_state_perform_move_up_action_failure() -> None:
         state._perform_move_up("any")
 
 
-def test_home_state_toggle_order_view_no_deck_data() -> None:
+def test_home_state_toggle_order_view_no_deck_data(mock_game: Mock) -> None:
     """Tests that the order view is not opened if deck data is missing."""
-    mock_game = Mock()
-    mock_game.view_manager = Mock()
     state = HomeState(mock_game)
 
     # Simulate character data being found, but deck data is missing
@@ -449,9 +508,8 @@ def test_home_state_toggle_order_view_no_deck_data() -> None:
     )
 
 
-def test_home_state_perform_move_down_action_failure() -> None:
+def test_home_state_perform_move_down_action_failure(mock_game: Mock) -> None:
     """Tests the failure path for the move down action when character is not found."""
-    mock_game = Mock()
     state = HomeState(mock_game)
     mock_game.character_service.get_character_data.return_value = None
 
@@ -459,9 +517,8 @@ def test_home_state_perform_move_down_action_failure() -> None:
         state._perform_move_down("any")
 
 
-def test_home_state_on_show_item_details_failure() -> None:
+def test_home_state_on_show_item_details_failure(mock_game: Mock) -> None:
     """Tests the failure path for showing item details."""
-    mock_game = Mock()
     state = HomeState(mock_game)
 
     # --- Test _on_show_item_details failure ---
@@ -475,32 +532,29 @@ def test_home_state_on_show_item_details_failure() -> None:
         mock_toggle_item.assert_not_called()
 
 
-def test_home_state_contract_view_logic() -> None:
+def test_home_state_contract_view_logic(
+    mock_game: Mock, view_mocks: SimpleNamespace
+) -> None:
     """Tests the HomeState's logic for managing contract views."""
-    mock_game = Mock()
-    mock_game.view_manager = Mock()
     state = HomeState(mock_game)
 
     # --- Test _toggle_contract_list_view success ---
     mock_contracts = [Mock(spec=ContractSummaryDTO)]
     mock_game.contract_service.get_available_contracts.return_value = mock_contracts
-    with patch(
-        "decker_pygame.presentation.states.states.ContractListView",
-        spec=ContractListView,
-    ) as mock_view_class:
-        mock_view_instance = mock_view_class.return_value
-        state._toggle_contract_list_view()
-
-        factory = mock_game.view_manager.toggle_view.call_args.args[1]
-        created_view = factory()
-
-        mock_view_class.assert_called_once_with(
-            position=(200, 150),
-            size=(450, 300),
-            on_contract_selected=state._on_contract_selected,
-        )
-        mock_view_instance.set_contracts.assert_called_once_with(mock_contracts)
-        assert created_view is mock_view_instance
+    mock_view_class = view_mocks.ContractListView
+    mock_view_instance = mock_view_class.return_value
+    state._toggle_contract_list_view()
+
+    factory = mock_game.view_manager.toggle_view.call_args.args[1]
+    created_view = factory()
+
+    mock_view_class.assert_called_once_with(
+        position=(200, 150),
+        size=(450, 300),
+        on_contract_selected=state._on_contract_selected,
+    )
+    mock_view_instance.set_contracts.assert_called_once_with(mock_contracts)
+    assert created_view is mock_view_instance
 
     # --- Test _toggle_contract_list_view no contracts ---
     mock_game.reset_mock()
@@ -515,20 +569,17 @@ def test_home_state_contract_view_logic() -> None:
     mock_dto = Mock(spec=ContractSummaryDTO)
     mock_dto.title = "Test Heist"
     mock_dto.id = "test_contract_id"
-    with patch(
-        "decker_pygame.presentation.states.states.ContractDataView",
-        spec=ContractDataView,
-    ) as mock_data_view_class:
-        state._on_contract_selected(mock_dto)
-        factory = mock_game.view_manager.toggle_view.call_args.args[1]
-        created_view = factory()
-        mock_data_view_class.assert_called_once_with(
-            position=(200, 150),
-            size=(400, 300),
-            contract=mock_dto,
-            on_accept=state._on_accept_contract,
-        )
-        assert created_view is mock_data_view_class.return_value
+    mock_data_view_class = view_mocks.ContractDataView
+    state._on_contract_selected(mock_dto)
+    factory = mock_game.view_manager.toggle_view.call_args.args[1]
+    created_view = factory()
+    mock_data_view_class.assert_called_once_with(
+        position=(200, 150),
+        size=(400, 300),
+        contract=mock_dto,
+        on_accept=state._on_accept_contract,
+    )
+    assert created_view is mock_data_view_class.return_value
 
     # --- Test _on_contract_selected with None ---
     mock_game.reset_mock()
@@ -554,25 +605,23 @@ def test_home_state_contract_view_logic() -> None:
     mock_game.set_state.assert_not_called()
 
 
-def test_home_state_ice_data_view_logic() -> None:
+def test_home_state_ice_data_view_logic(
+    mock_game: Mock, view_mocks: SimpleNamespace
+) -> None:
     """Tests the HomeState's logic for managing the IceDataView."""
-    mock_game = Mock()
-    mock_game.view_manager = Mock()
     state = HomeState(mock_game)
 
     # --- Test toggling the view with data ---
     mock_ice_data = Mock(spec=IceDataViewDTO)
-    with patch(
-        "decker_pygame.presentation.states.states.IceDataView", spec=IceDataView
-    ) as mock_view_class:
-        state._toggle_ice_data_view(mock_ice_data)
-        factory = mock_game.view_manager.toggle_view.call_args.args[1]
-        created_view = factory()
-
-        mock_view_class.assert_called_once_with(
-            data=mock_ice_data, on_close=state._toggle_ice_data_view
-        )
-        assert created_view is mock_view_class.return_value
+    mock_view_class = view_mocks.IceDataView
+    state._toggle_ice_data_view(mock_ice_data)
+    factory = mock_game.view_manager.toggle_view.call_args.args[1]
+    created_view = factory()
+
+    mock_view_class.assert_called_once_with(
+        data=mock_ice_data, on_close=state._toggle_ice_data_view
+    )
+    assert created_view is mock_view_class.return_value
 
     # --- Test toggling the view without data (to close it) ---
     mock_game.view_manager.reset_mock()
@@ -581,38 +630,10 @@ def test_home_state_ice_data_view_logic() -> None:
     assert factory() is None
 
 
-def test_home_state_build_view_logic() -> None:
-    """Tests the HomeState's logic for managing the BuildView."""
-    mock_game = Mock()
-    mock_game.view_manager = Mock()
+def test_home_state_build_view_logic(mock_game: Mock) -> None:
+    """Tests the HomeState's build click handling."""
     state = HomeState(mock_game)
 
-    # --- Test _toggle_build_view success ---
-    mock_schematics = [Mock()]
-    mock_game.crafting_service.get_character_schematics.return_value = mock_schematics
-    with patch(
-        "decker_pygame.presentation.states.states.BuildView", spec=BuildView
-    ) as mock_view_class:
-        state._toggle_build_view()
-        factory = mock_game.view_manager.toggle_view.call_args.args[1]
-        created_view = factory()
-
-        mock_view_class.assert_called_once_with(
-            position=(200, 150),
-            size=(400, 300),
-            schematics=mock_schematics,
-            on_build_click=state._handle_build_click,
-        )
-        assert created_view is mock_view_class.return_value
-
-    # --- Test _toggle_build_view no schematics ---
-    mock_game.reset_mock()
-    mock_game.crafting_service.get_character_schematics.return_value = []
-    state._toggle_build_view()
-    factory = mock_game.view_manager.toggle_view.call_args.args[1]
-    assert factory() is None
-    mock_game.show_message.assert_called_once_with("No schematics known.")
-
     # --- Test _handle_build_click success ---
     mock_game.reset_mock()
     state._handle_build_click("TestSchematic")
@@ -628,54 +649,12 @@ def test_home_state_build_view_logic() -> None:
     mock_game.show_message.assert_called_once_with("Crafting failed: Test Error")
 
 
-def test_home_state_shop_view_logic() -> None:
-    """Tests the HomeState's logic for managing the ShopView and ShopItemView."""
-    mock_game = Mock()
-    mock_game.view_manager = Mock()
+def test_home_state_shop_view_logic(
+    mock_game: Mock, view_mocks: SimpleNamespace
+) -> None:
+    """Tests the HomeState's shop callbacks and ShopItemView handling."""
     state = HomeState(mock_game)
 
-    # --- Test _toggle_shop_view success ---
-    mock_shop_data = Mock(spec=ShopViewDTO)
-    mock_game.shop_service.get_shop_view_data.return_value = mock_shop_data
-    with patch(
-        "decker_pygame.presentation.states.states.ShopView", spec=ShopView
-    ) as mock_view_class:
-        state._toggle_shop_view()
-        factory = mock_game.view_manager.toggle_view.call_args.args[1]
-        created_view = factory()
-
-        mock_view_class.assert_called_once_with(
-            data=mock_shop_data,
-            on_close=state._toggle_shop_view,
-            on_purchase=state._on_purchase,
-            on_view_details=state._on_show_item_details,
-        )
-        assert created_view is mock_view_class.return_value
-
-    # --- Test _toggle_shop_view no data ---
-    mock_game.reset_mock()
-    mock_game.shop_service.get_shop_view_data.return_value = None
-    state._toggle_shop_view()
-    factory = mock_game.view_manager.toggle_view.call_args.args[1]
-    assert factory() is None
-    mock_game.show_message.assert_called_once_with("Error: Could not load shop data.")
-
-    # --- Test _on_purchase callback ---
-    mock_game.reset_mock()
-
-    def mock_executor(action, toggler):
-        action()
-
-    mock_game._execute_and_refresh_view.side_effect = mock_executor
-    state._on_purchase("TestItem")
-    mock_game.shop_service.purchase_item.assert_called_once_with(
-        mock_game.character_id, "TestItem", "DefaultShop"
-    )
-    mock_game._execute_and_refresh_view.assert_called_once()
-    assert (
-        mock_game._execute_and_refresh_view.call_args.args[1] == state._toggle_shop_view
-    )
-
     # --- Test _on_show_item_details success ---
     mock_game.reset_mock()
     mock_item_data = Mock(spec=ShopItemViewDTO)
@@ -702,124 +681,19 @@ def test_home_state_shop_view_logic() -> None:
 
     # --- Test _toggle_shop_item_view factory ---
     mock_game.reset_mock()
-    with patch(
-        "decker_pygame.presentation.states.states.ShopItemView", spec=ShopItemView
-    ) as mock_item_view_class:
-        state._toggle_shop_item_view(mock_item_data)
-        factory = mock_game.view_manager.toggle_view.call_args.args[1]
-        created_view = factory()
-
-        mock_item_view_class.assert_called_once_with(
-            data=mock_item_data,
-            on_close=state._toggle_shop_item_view,
-        )
-        assert created_view is mock_item_view_class.return_value
-
-    # --- Test _toggle_shop_item_view with no data (to close) ---
-    mock_game.reset_mock()
-    state._toggle_shop_item_view(None)
+    mock_item_view_class = view_mocks.ShopItemView
+    state._toggle_shop_item_view(mock_item_data)
     factory = mock_game.view_manager.toggle_view.call_args.args[1]
-    assert factory() is None
+    created_view = factory()
 
+    mock_item_view_class.assert_called_once_with(
+        data=mock_item_data,
+        on_close=state._toggle_shop_item_view,
+    )
+    assert created_view is mock_item_view_class.return_value
 
-def test_home_state_transfer_view_logic() -> None:
-    """Tests the HomeState's logic for managing the TransferView."""
-    mock_game = Mock()
-    mock_game.view_manager = Mock()
-    state = HomeState(mock_game)
-
-    # --- Test _toggle_transfer_view success ---
-    mock_transfer_data = Mock(spec=TransferViewDTO)
-    mock_game.deck_service.get_transfer_view_data.return_value = mock_transfer_data
-    with patch(
-        "decker_pygame.presentation.states.states.TransferView", spec=TransferView
-    ) as mock_view_class:
-        state._toggle_transfer_view()
-        factory = mock_game.view_manager.toggle_view.call_args.args[1]
-        created_view = factory()
-
-        mock_view_class.assert_called_once_with(
-            data=mock_transfer_data,
-            on_close=state._toggle_transfer_view,
-            on_move_to_deck=state._on_move_program_to_deck,
-            on_move_to_storage=state._on_move_program_to_storage,
-        )
-        assert created_view is mock_view_class.return_value
-
-    # --- Test _toggle_transfer_view no data ---
+    # --- Test _toggle_shop_item_view with no data (to close) ---
     mock_game.reset_mock()
-    mock_game.deck_service.get_transfer_view_data.return_value = None
-    state._toggle_transfer_view()
+    state._toggle_shop_item_view(None)
     factory = mock_game.view_manager.toggle_view.call_args.args[1]
     assert factory() is None
-    mock_game.show_message.assert_called_once_with(
-        "Error: Could not retrieve transfer data."
-    )
-
-    # --- Test _on_move_program_to_deck callback ---
-    mock_game.reset_mock()
-
-    def mock_executor(action, toggler):
-        action()
-
-    mock_game._execute_and_refresh_view.side_effect = mock_executor
-    state._on_move_program_to_deck("TestProgram")
-    mock_game.deck_service.move_program_to_deck.assert_called_once_with(
-        mock_game.character_id, "TestProgram"
-    )
-    mock_game._execute_and_refresh_view.assert_called_once()
-    assert (
-        mock_game._execute_and_refresh_view.call_args.args[1]
-        == state._toggle_transfer_view
-    )
-
-    # --- Test _on_move_program_to_storage callback ---
-    mock_game.reset_mock()
-    mock_game._execute_and_refresh_view.side_effect = mock_executor
-    state._on_move_program_to_storage("TestProgram2")
-    mock_game.deck_service.move_program_to_storage.assert_called_once_with(
-        mock_game.character_id, "TestProgram2"
-    )
-    assert (
-        mock_game._execute_and_refresh_view.call_args.args[1]
-        == state._toggle_transfer_view
-    )
-
-
-def test_matrix_run_state_lifecycle() -> None:
-    """Tests that MatrixRunState correctly toggles the MatrixRunView."""
-    mock_game = Mock()
-    mock_game.view_manager = Mock()
-    state = MatrixRunState(mock_game)
-
-    # --- Test on_enter ---
-    state.on_enter()
-    mock_game.view_manager.toggle_view.assert_called_once()
-
-    # Check the arguments passed to toggle_view
-    view_attr_arg = mock_game.view_manager.toggle_view.call_args.args[0]
-    factory_arg = mock_game.view_manager.toggle_view.call_args.args[1]
-    assert view_attr_arg == "matrix_run_view"
-
-    # Test the factory function itself
-    with patch(
-        "decker_pygame.presentation.states.states.MatrixRunView", spec=MatrixRunView
-    ) as mock_view_class:
-        created_view = factory_arg()
-        mock_view_class.assert_called_once_with(asset_service=mock_game.asset_service)
-        assert created_view is mock_view_class.return_value
-
-    # --- Test on_exit ---
-    mock_game.view_manager.reset_mock()
-    state.on_exit()
-    mock_game.view_manager.toggle_view.assert_called_once_with(
-        "matrix_run_view", state._factory
-    )
-
-    # --- Test update, draw, and event handling delegation ---
-    state.handle_event(pygame.event.Event(pygame.USEREVENT))
-    state.update(0.016)
-    mock_game.update_sprites.assert_called_once_with(0.016)
-    mock_screen = Mock(spec=pygame.Surface)
-    state.draw(mock_screen)
-    mock_game.all_sprites.draw.assert_called_once_with(mock_screen)
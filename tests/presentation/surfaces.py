@@ -0,0 +1,10 @@
+"""Shared surfaces for the presentation tests.
+
+Kept out of the conftest files so that importing them from a test module yields
+the same objects the fixtures use.
+"""
+
+import pygame
+
+# Stand-in for rendered text and widget images; tests never inspect its pixels.
+DUMMY_SURFACE = pygame.Surface((1, 1), 0, 8)
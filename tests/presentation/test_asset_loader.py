@@ -61,6 +61,7 @@ def test_load_images_with_resize(
         (None, False),
         ((0, 0, 0), True),
     ],
+    ids=["no_colorkey", "colorkey"],
 )
 def test_load_spritesheet(
     mocker: MockerFixture, colorkey: Optional[tuple], expect_colorkey_call: bool
@@ -116,3 +117,34 @@ def test_load_spritesheet(
     else:
         cast(MagicMock, sprites[0].set_colorkey).assert_not_called()
         cast(MagicMock, sprites[1].set_colorkey).assert_not_called()
+
+
+def test_load_images_falls_back_when_convert_alpha_fails(
+    mock_pygame_image: types.ModuleType, asset_directory: Path
+):
+    """Test that images are kept unconverted when there is no display to convert to."""
+    loaded = mock_pygame_image.image.load.return_value
+    loaded.convert_alpha.side_effect = pygame.error("No video mode has been set")
+
+    images = load_images(base_path=asset_directory, subdirectory="programs")
+
+    assert images == [loaded, loaded]
+
+
+class _HeadlessSurface(pygame.Surface):
+    """A real surface whose convert_alpha() fails as it does without a display."""
+
+    def convert_alpha(self, *_args: object) -> pygame.Surface:
+        raise pygame.error("No video mode has been set")
+
+
+def test_load_spritesheet_falls_back_when_convert_alpha_fails(mocker: MockerFixture):
+    """Test that the raw sheet is sliced when convert_alpha() is unavailable."""
+    mocker.patch("pygame.image.load", return_value=_HeadlessSurface((64, 32)))
+
+    sprites, dimensions = load_spritesheet(
+        "dummy_sheet.bmp", 32, 32, base_path=Path("/fake/path")
+    )
+
+    assert len(sprites) == 2
+    assert dimensions == (64, 32)
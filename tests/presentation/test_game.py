@@ -66,8 +66,8 @@ def game_with_mocks() -> Generator[Mocks]:
     mock_matrix_run_service = Mock(spec=MatrixRunServiceInterface)
     mock_logging_service = Mock(spec=LoggingServiceInterface)
     mock_event_dispatcher = Mock(spec=EventDispatcher)
-    dummy_player_id = PlayerId(uuid.uuid4())
-    dummy_character_id = CharacterId(uuid.uuid4())
+    dummy_player_id = PlayerId(uuid.UUID(int=1))
+    dummy_character_id = CharacterId(uuid.UUID(int=2))
 
     # Configure the asset service mock to return a valid icon
     mock_asset_service.get_spritesheet.return_value = [pygame.Surface((16, 16))]
@@ -376,6 +376,7 @@ def test_toggle_options_view(game_with_mocks: Mocks):
         ("_on_music_volume_change", "set_music_volume"),
         ("_on_sfx_volume_change", "set_sfx_volume"),
     ],
+    ids=["master", "music", "sfx"],
 )
 def test_on_volume_change_callbacks(
     game_with_mocks: Mocks, callback_name: str, service_method_name: str
@@ -594,7 +595,7 @@ def test_on_build_schematic(game_with_mocks: Mocks):
     """Tests the callback for building a schematic."""
     mocks = game_with_mocks
     game = mocks.game
-    schematic_id = str(uuid.uuid4())
+    schematic_id = str(uuid.UUID(int=1))
 
     with (
         patch.object(game, "toggle_project_data_view") as mock_toggle,
@@ -613,7 +614,7 @@ def test_on_trash_schematic(game_with_mocks: Mocks):
     """Tests the callback for trashing a schematic."""
     mocks = game_with_mocks
     game = mocks.game
-    schematic_id = str(uuid.uuid4())
+    schematic_id = str(uuid.UUID(int=2))
 
     with (
         patch.object(game, "toggle_project_data_view") as mock_toggle,
@@ -9,6 +9,13 @@ from decker_pygame.presentation.game import Game
 from decker_pygame.presentation.input_handler import PygameInputHandler
 from decker_pygame.presentation.states.game_states import GameState
 
+# The handler only reads these events, so each test can share the same instances.
+_QUIT_EVENT = pygame.event.Event(pygame.QUIT)
+_MOUSE_EVENT = pygame.event.Event(pygame.MOUSEBUTTONDOWN)
+_KEY_A_EVENT = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)
+_KEY_R_EVENT = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_r)
+_KEY_X_EVENT = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_x)
+
 
 @pytest.fixture
 def mock_game() -> Mock:
@@ -37,7 +44,7 @@ def test_handle_quit_event(
 ):
     """Tests that a QUIT event calls game.quit()."""
     handler = PygameInputHandler(mock_game, mock_logging_service, mock_debug_actions)
-    quit_event = pygame.event.Event(pygame.QUIT)
+    quit_event = _QUIT_EVENT
 
     with patch("pygame.event.get", return_value=[quit_event]):
         handler.handle_events()
@@ -52,6 +59,7 @@ def test_handle_quit_event(
         (pygame.K_m, "log_matrix_event", True),
         (pygame.K_q, "quit", False),
     ],
+    ids=["home", "matrix_event", "quit"],
 )
 def test_handle_keydown_events(
     key: int,
@@ -82,7 +90,7 @@ def test_handle_keydown_r_sets_matrix_run_state(
 ):
     """Tests that pressing 'r' sets the game state to MATRIX_RUN."""
     handler = PygameInputHandler(mock_game, mock_logging_service, mock_debug_actions)
-    key_event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_r})
+    key_event = _KEY_R_EVENT
 
     with patch("pygame.event.get", return_value=[key_event]):
         handler.handle_events()
@@ -96,7 +104,7 @@ def test_handle_unmapped_keydown(
     """Tests that a keydown event not in the map does nothing."""
     handler = PygameInputHandler(mock_game, mock_logging_service, mock_debug_actions)
     # Use a key that is not in the handler's key_map
-    unmapped_key_event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_x})
+    unmapped_key_event = _KEY_X_EVENT
 
     with patch("pygame.event.get", return_value=[unmapped_key_event]):
         handler.handle_events()
@@ -110,7 +118,7 @@ def test_handle_events_delegates_to_top_modal_view(
 ):
     """Tests that events are delegated only to the top-most view on the modal stack."""
     handler = PygameInputHandler(mock_game, mock_logging_service, mock_debug_actions)
-    mouse_event = pygame.event.Event(pygame.MOUSEBUTTONDOWN)
+    mouse_event = _MOUSE_EVENT
 
     # Create mock views that conform to the Eventful protocol
     view1 = Mock(spec=["handle_event"])
@@ -132,7 +140,7 @@ def test_logs_keypress_in_dev_mode(
     handler = PygameInputHandler(mock_game, mock_logging_service, mock_debug_actions)
 
     with patch("decker_pygame.presentation.input_handler.DEV_SETTINGS.enabled", True):
-        key_event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_a})
+        key_event = _KEY_A_EVENT
         with patch("pygame.event.get", return_value=[key_event]):
             handler.handle_events()
 
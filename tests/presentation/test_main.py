@@ -103,19 +103,19 @@ def test_main_function(mocker: MockerFixture) -> None:
 
     # Configure the mock service's return values to be predictable
     mock_player_service_instance = mock_player_service_class.return_value
-    deckard_player_id = PlayerId(uuid.uuid4())
-    rynn_player_id = PlayerId(uuid.uuid4())
+    deckard_player_id = PlayerId(uuid.UUID(int=1))
+    rynn_player_id = PlayerId(uuid.UUID(int=2))
     mock_player_service_instance.create_new_player.side_effect = [
         deckard_player_id,
         rynn_player_id,
     ]
     mock_deck_service_instance = mock_deck_service_class.return_value
-    mock_deck_id = DeckId(uuid.uuid4())
+    mock_deck_id = DeckId(uuid.UUID(int=3))
     mock_deck_service_instance.create_deck.return_value = mock_deck_id
 
     # Configure the mock character that will be returned by the factory
     mock_character = mock_character_create.return_value
-    mock_character.id = CharacterId(uuid.uuid4())
+    mock_character.id = CharacterId(uuid.UUID(int=4))
 
     # Call the main function
     main()
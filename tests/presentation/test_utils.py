@@ -3,7 +3,11 @@ from unittest.mock import Mock, patch
 import pygame
 import pytest
 
-from decker_pygame.presentation.utils import get_and_ensure_rect, scale_icons
+from decker_pygame.presentation.utils import (
+    create_display_surface,
+    get_and_ensure_rect,
+    scale_icons,
+)
 
 # --- Tests for scale_icons ---
 
@@ -36,6 +40,43 @@ def test_scale_icons_with_empty_list():
         mock_scale.assert_not_called()
 
 
+# --- Tests for create_display_surface ---
+
+
+def test_create_display_surface_without_display():
+    """Tests that a plain surface is returned when no display mode is set."""
+    with patch(
+        "decker_pygame.presentation.utils.pygame.display.get_surface",
+        return_value=None,
+    ):
+        surface = create_display_surface((20, 10))
+
+    assert isinstance(surface, pygame.Surface)
+    assert surface.get_size() == (20, 10)
+
+
+def test_create_display_surface_converts_to_display_format():
+    """Tests that the surface is converted once a display mode is set."""
+    converted = Mock(spec=pygame.Surface)
+    mock_surface = Mock(spec=pygame.Surface)
+    mock_surface.convert.return_value = converted
+
+    with (
+        patch(
+            "decker_pygame.presentation.utils.pygame.display.get_surface",
+            return_value=Mock(spec=pygame.Surface),
+        ),
+        patch(
+            "decker_pygame.presentation.utils.pygame.Surface",
+            return_value=mock_surface,
+        ),
+    ):
+        surface = create_display_surface((20, 10))
+
+    assert surface is converted
+    mock_surface.convert.assert_called_once_with()
+
+
 # --- Tests for get_and_ensure_rect ---
 
 
@@ -10,6 +10,7 @@ from decker_pygame.presentation.components.button import Button
 from decker_pygame.presentation.components.label import Label
 from decker_pygame.presentation.components.list_view import ListView
 from decker_pygame.presentation.components.project_data_view import ProjectDataView
+from tests.presentation.surfaces import DUMMY_SURFACE
 
 
 @pytest.fixture(autouse=True)
@@ -74,8 +75,8 @@ def test_initialization_and_widget_creation(sample_dto, mock_callbacks):
         # Configure the mock instances to behave like sprites so they can be drawn
         for mock_class in [MockLabel, MockListView, MockButton]:
             mock_instance = mock_class.return_value
-            mock_instance.image = pygame.Surface((10, 10))
-            mock_instance.rect = mock_instance.image.get_rect()
+            mock_instance.image = DUMMY_SURFACE
+            mock_instance.rect = pygame.Rect(0, 0, 10, 10)
             # Also mock set_enabled for Button
             if mock_class is MockButton:
                 mock_instance.set_enabled = Mock()